@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+import argparse
+import asyncio
+import multiprocessing
+import time
+
+from mk8dx.lounge_api import LoungeClient
+from mk8dx.lounge_api.fake_server import FakeLoungeData, FakeLoungeServer
+
+
+def serve(queue: multiprocessing.Queue, options: dict[str, Any]) -> None:
+    async def run() -> None:
+        data = FakeLoungeData(num_players=options['players'], num_tables=options['tables'])
+        server = FakeLoungeServer(data=data)
+        queue.put(await server.start())
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+async def backfill(base_url: str, args: argparse.Namespace, executor: Optional[Executor]) -> None:
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        # how late a 1 ms sleep wakes up is what every other coroutine of a bot would feel
+        while not done.is_set():
+            started_at = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - started_at - 0.001)
+
+    # the fake server spaces tables ten minutes apart starting on 2023-01-01
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    end = start + timedelta(minutes=10 * args.tables)
+    window = timedelta(days=args.window)
+    tables = 0
+    ticking = asyncio.ensure_future(ticker())
+    started_at = time.perf_counter()
+    client = LoungeClient(base_url=base_url, executor=executor, offload_threshold=args.threshold)
+    async with client:
+        after = start
+        while after < end:
+            result = await client.get_list(after=after.isoformat(), before=(after + window).isoformat())
+            tables += len(result or [])
+            after += window
+    elapsed = time.perf_counter() - started_at
+    done.set()
+    await ticking
+    lags.sort()
+    mode = 'inline' if executor is None else 'process pool'
+    print(
+        f'{mode:>12}: {tables} tables in {elapsed:.2f} s, '
+        f'loop lag p50 {lags[len(lags) // 2] * 1000:.1f} ms, '
+        f'p99 {lags[int(len(lags) * 0.99)] * 1000:.1f} ms, max {lags[-1] * 1000:.1f} ms'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Event loop latency while backfilling tables.')
+    parser.add_argument('--players', type=int, default=2000)
+    parser.add_argument('--tables', type=int, default=20000)
+    parser.add_argument('--window', type=float, default=14.0, help='days per /table/list request')
+    parser.add_argument('--threshold', type=int, default=1 << 18)
+    parser.add_argument('--workers', type=int, default=2)
+    args = parser.parse_args()
+
+    queue: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(queue, vars(args)), daemon=True)
+    server.start()
+    try:
+        base_url = queue.get(timeout=120)
+        asyncio.run(backfill(base_url, args, None))
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            # start the workers up front, forking them would otherwise count as loop lag
+            list(executor.map(abs, range(args.workers)))
+            asyncio.run(backfill(base_url, args, executor))
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
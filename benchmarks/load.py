@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable
+import argparse
+import asyncio
+import multiprocessing
+import random
+import statistics
+import time
+
+from mk8dx.lounge_api import LoungeAPIError, LoungeClient, RateLimiter, ResponseCache
+from mk8dx.lounge_api.fake_server import FakeLoungeData, FakeLoungeServer
+
+
+def serve(queue: multiprocessing.Queue, options: dict[str, Any]) -> None:
+    # the server runs in its own process so that it does not compete with the client's event loop
+    async def run() -> None:
+        data = FakeLoungeData(num_players=options['players'], num_tables=options['tables'])
+        server = FakeLoungeServer(
+            data=data,
+            latency=options['latency'],
+            jitter=options['jitter'],
+            error_rate=options['error_rate'],
+            throttle_rate=options['throttle_rate']
+        )
+        queue.put(await server.start())
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+def operations(args: argparse.Namespace) -> list[Callable[[LoungeClient], Awaitable[Any]]]:
+    return [
+        lambda client: client.get_player(id=random.randint(1, args.players)),
+        lambda client: client.get_player_details(id=random.randint(1, args.players)),
+        lambda client: client.get_table(table_id=random.randint(1, args.tables)),
+        lambda client: client.get_leaderboard(season=8, skip=random.randrange(0, args.players, 50))
+    ]
+
+
+async def run_load(base_url: str, args: argparse.Namespace) -> None:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + args.duration
+    choices = operations(args)
+    client = LoungeClient(
+        base_url=base_url,
+        cache=ResponseCache() if args.cache else None,
+        rate_limiter=RateLimiter(rate=args.rate, burst=args.concurrency) if args.rate else None
+    )
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started_at = time.perf_counter()
+            try:
+                await random.choice(choices)(client)
+            except (LoungeAPIError, OSError, asyncio.TimeoutError):
+                errors += 1
+            latencies.append(time.perf_counter() - started_at)
+
+    async with client:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f'requests    : {len(latencies)} in {elapsed:.2f} s ({len(latencies) / elapsed:.0f} req/s)')
+    print(f'errors      : {errors}')
+    print(f'latency p50 : {quantiles[49] * 1000:.2f} ms')
+    print(f'latency p95 : {quantiles[94] * 1000:.2f} ms')
+    print(f'latency p99 : {quantiles[98] * 1000:.2f} ms')
+    print(f'latency max : {latencies[-1] * 1000:.2f} ms')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Load test LoungeClient against a fake Lounge API.')
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--players', type=int, default=2000)
+    parser.add_argument('--tables', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--jitter', type=float, default=0.01)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--rate', type=float, default=0.0, help='client requests/sec limit, 0 for none')
+    parser.add_argument('--cache', action='store_true')
+    args = parser.parse_args()
+
+    queue: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(queue, vars(args)), daemon=True)
+    server.start()
+    try:
+        asyncio.run(run_load(queue.get(timeout=60), args))
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+import argparse
+import gc
+import json
+import tracemalloc
+
+from mk8dx.lounge_api import Leaderboard, TableDetails
+from mk8dx.lounge_api.decode import DecodeContext
+from mk8dx.lounge_api.fake_server import FakeLoungeData
+
+
+def retained(text: str, load: Callable[[Any], Any]) -> tuple[int, Any]:
+    # bytes still allocated once the decoded JSON itself has been dropped
+    gc.collect()
+    tracemalloc.start()
+    data = json.loads(text)
+    value = load(data)
+    del data
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Memory retained by decoded lounge_api models.')
+    parser.add_argument('--players', type=int, default=2000)
+    parser.add_argument('--tables', type=int, default=20000)
+    args = parser.parse_args()
+
+    data = FakeLoungeData(num_players=args.players, num_tables=args.tables)
+    tables_text = json.dumps(data.tables)
+    leaderboard_text = json.dumps({
+        'totalPlayers': len(data.players),
+        'data': [data.leaderboard_player(p, rank) for rank, p in enumerate(data.players, start=1)]
+    })
+    cases = {
+        'TableDetails': (
+            tables_text,
+            # a fresh context per table is the closest to decoding without sharing
+            lambda tables: [TableDetails.loads(table, context=DecodeContext()) for table in tables],
+            lambda tables: TableDetails.loads_list(tables)
+        ),
+        'Leaderboard': (
+            leaderboard_text,
+            lambda leaderboard: Leaderboard(
+                total_players=leaderboard['totalPlayers'],
+                data=[
+                    Leaderboard.Player.laods(player, context=DecodeContext())
+                    for player in leaderboard['data']
+                ]
+            ),
+            lambda leaderboard: Leaderboard.loads(leaderboard)
+        )
+    }
+    for name, (text, separate, shared) in cases.items():
+        separate_size, _ = retained(text, separate)
+        shared_size, _ = retained(text, shared)
+        print(
+            f'{name:>13}: {separate_size / 2 ** 20:8.1f} MiB without sharing, '
+            f'{shared_size / 2 ** 20:8.1f} MiB shared ({1 - shared_size / separate_size:.0%} less)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+import json
+import pickle
+import timeit
+
+from mk8dx.lounge_api.fake_server import FakeLoungeData
+
+
+def measure(function: Callable[[], Any]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=5))
+
+
+def main() -> None:
+    data = FakeLoungeData()
+    print(f'{"model":>14} {"format":>7} {"bytes":>10} {"encode ms":>10} {"decode ms":>10}')
+    for name, (model, values) in data.models(num_details=200).items():
+        # round trips must reproduce the same API representation
+        for value in values:
+            assert model.from_bytes(value.to_bytes()).dumps() == value.dumps(), name
+            assert model.loads(value.dumps()).dumps() == value.dumps(), name
+        formats = {
+            'json': (
+                lambda: [json.dumps(value.dumps()) for value in values],
+                lambda encoded: [model.loads(json.loads(text)) for text in encoded],
+                lambda encoded: sum(len(text.encode()) for text in encoded)
+            ),
+            'pickle': (
+                lambda: [pickle.dumps(value, pickle.HIGHEST_PROTOCOL) for value in values],
+                lambda encoded: [pickle.loads(blob) for blob in encoded],
+                lambda encoded: sum(map(len, encoded))
+            ),
+            'binary': (
+                lambda: [value.to_bytes() for value in values],
+                lambda encoded: [model.from_bytes(blob) for blob in encoded],
+                lambda encoded: sum(map(len, encoded))
+            )
+        }
+        if hasattr(model, 'to_bytes_list'):
+            # one shared string table for the whole batch
+            assert [v.dumps() for v in model.from_bytes_list(model.to_bytes_list(values))] == [
+                value.dumps() for value in values
+            ], name
+            formats['batch'] = (
+                lambda: model.to_bytes_list(values),
+                lambda encoded: model.from_bytes_list(encoded),
+                len
+            )
+        for format, (encode, decode, size) in formats.items():
+            encoded = encode()
+            encode_seconds = measure(encode)
+            decode_seconds = measure(lambda: decode(encoded))
+            print(
+                f'{name:>14} {format:>7} {size(encoded):>10} '
+                f'{encode_seconds * 1000:>10.1f} {decode_seconds * 1000:>10.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
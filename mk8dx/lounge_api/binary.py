@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Optional, TypeVar
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+import struct
+
+T = TypeVar('T')
+
+# layout: MAGIC, VERSION, type code (with LIST set for a list of models), the string table as a
+# varint count followed by length-prefixed UTF-8 strings, then the body, which refers to strings
+# by their index in the table
+MAGIC = b'LA'
+VERSION = 1
+
+PLAYER = 1
+PLAYER_DETAILS = 2
+PLAYER_LIST = 3
+LEADERBOARD = 4
+TABLE_DETAILS = 5
+PENALTY = 6
+BONUS = 7
+LIST = 0x80
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_DOUBLE = struct.Struct('<d')
+
+_enum_indices: dict[type[Enum], dict[Enum, int]] = {}
+_enum_members: dict[type[Enum], tuple[Enum, ...]] = {}
+
+
+class BinaryWriter:
+
+    __slots__ = (
+        '_body',
+        '_strings'
+    )
+
+    def __init__(self) -> None:
+        self._body: bytearray = bytearray()
+        self._strings: dict[str, int] = {}
+
+    def uint(self, value: int) -> None:
+        body = self._body
+        while value >= 0x80:
+            body.append((value & 0x7F) | 0x80)
+            value >>= 7
+        body.append(value)
+
+    def int(self, value: int) -> None:
+        # zigzag, so small negative numbers stay short
+        self.uint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def optional_int(self, value: Optional[int]) -> None:
+        # 0 is None, anything else is the zigzag value plus one
+        if value is None:
+            self._body.append(0)
+        else:
+            self.uint((value << 1 if value >= 0 else (-value << 1) - 1) + 1)
+
+    def bool(self, value: bool) -> None:
+        self._body.append(1 if value else 0)
+
+    def float(self, value: float) -> None:
+        self._body += _DOUBLE.pack(value)
+
+    def optional_float(self, value: Optional[float]) -> None:
+        if value is None:
+            self._body.append(0)
+        else:
+            self._body.append(1)
+            self._body += _DOUBLE.pack(value)
+
+    def optional_str(self, value: Optional[str]) -> None:
+        if value is None:
+            self._body.append(0)
+            return
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+        self.uint(index + 1)
+
+    def str(self, value: str) -> None:
+        self.optional_str(value)
+
+    def optional_datetime(self, value: Optional[datetime]) -> None:
+        if value is None:
+            self._body.append(0)
+            return
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        self.optional_int((value - _EPOCH) // _MICROSECOND)
+
+    def datetime(self, value: datetime) -> None:
+        self.optional_datetime(value)
+
+    def optional_enum(self, value: Optional[Enum]) -> None:
+        if value is None:
+            self._body.append(0)
+            return
+        indices = _enum_indices.get(type(value))
+        if indices is None:
+            indices = _enum_indices[type(value)] = {member: i for i, member in enumerate(type(value))}
+        self.uint(indices[value] + 1)
+
+    def enum(self, value: Enum) -> None:
+        self.optional_enum(value)
+
+    def getvalue(self, type_code: int) -> bytes:
+        header = BinaryWriter()
+        header._body += MAGIC
+        header._body.append(VERSION)
+        header._body.append(type_code)
+        header.uint(len(self._strings))
+        for value in self._strings:
+            encoded = value.encode()
+            header.uint(len(encoded))
+            header._body += encoded
+        return bytes(header._body + self._body)
+
+
+class BinaryReader:
+
+    __slots__ = (
+        '_data',
+        '_position',
+        '_strings'
+    )
+
+    def __init__(self, data: bytes, type_code: int) -> None:
+        if data[:2] != MAGIC:
+            raise ValueError('not a serialized lounge_api model')
+        if data[2] != VERSION:
+            raise ValueError(f'unsupported serialization version {data[2]}')
+        if data[3] != type_code:
+            raise ValueError(f'expected type code {type_code}, got {data[3]}')
+        self._data: bytes = data
+        self._position: int = 4
+        strings = []
+        for _ in range(self.uint()):
+            length = self.uint()
+            strings.append(data[self._position:self._position + length].decode())
+            self._position += length
+        self._strings: list[str] = strings
+
+    def uint(self) -> int:
+        data = self._data
+        position = self._position
+        byte = data[position]
+        position += 1
+        if byte < 0x80:
+            self._position = position
+            return byte
+        value = byte & 0x7F
+        shift = 7
+        while byte & 0x80:
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+        self._position = position
+        return value
+
+    def int(self) -> int:
+        value = self.uint()
+        return -((value + 1) >> 1) if value & 1 else value >> 1
+
+    def optional_int(self) -> Optional[int]:
+        value = self.uint()
+        if not value:
+            return None
+        value -= 1
+        return -((value + 1) >> 1) if value & 1 else value >> 1
+
+    def bool(self) -> bool:
+        value = self._data[self._position]
+        self._position += 1
+        return bool(value)
+
+    def float(self) -> float:
+        value = _DOUBLE.unpack_from(self._data, self._position)[0]
+        self._position += 8
+        return value
+
+    def optional_float(self) -> Optional[float]:
+        if not self.bool():
+            return None
+        return self.float()
+
+    def optional_str(self) -> Optional[str]:
+        index = self.uint()
+        if not index:
+            return None
+        return self._strings[index - 1]
+
+    def str(self) -> str:
+        index = self._data[self._position]
+        if 0 < index < 0x80:
+            self._position += 1
+            return self._strings[index - 1]
+        index = self.uint()
+        if not index:
+            raise ValueError('missing value for a required string')
+        return self._strings[index - 1]
+
+    def optional_datetime(self) -> Optional[datetime]:
+        value = self.optional_int()
+        if value is None:
+            return None
+        return _EPOCH + timedelta(microseconds=value)
+
+    def datetime(self) -> datetime:
+        value = self.optional_datetime()
+        if value is None:
+            raise ValueError('missing value for a required datetime')
+        return value
+
+    def optional_enum(self, enum_type: type[Enum]) -> Optional[Enum]:
+        index = self.uint()
+        if not index:
+            return None
+        members = _enum_members.get(enum_type)
+        if members is None:
+            members = _enum_members[enum_type] = tuple(enum_type)
+        return members[index - 1]
+
+    def enum(self, enum_type: type[Enum]) -> Enum:
+        value = self.optional_enum(enum_type)
+        if value is None:
+            raise ValueError(f'missing value for a required {enum_type.__name__}')
+        return value
+
+
+def to_bytes(value: Any, type_code: int) -> bytes:
+    writer = BinaryWriter()
+    value.write_binary(writer)
+    return writer.getvalue(type_code)
+
+
+def from_bytes(data: bytes, type_code: int, read: Callable[[BinaryReader], T]) -> T:
+    return read(BinaryReader(data, type_code))
+
+
+def to_bytes_list(values: list[Any], type_code: int) -> bytes:
+    writer = BinaryWriter()
+    writer.uint(len(values))
+    for value in values:
+        value.write_binary(writer)
+    return writer.getvalue(type_code | LIST)
+
+
+def from_bytes_list(data: bytes, type_code: int, read: Callable[[BinaryReader], T]) -> list[T]:
+    reader = BinaryReader(data, type_code | LIST)
+    return [read(reader) for _ in range(reader.uint())]
+
+
+def iter_bytes_list(data: bytes, type_code: int, read: Callable[[BinaryReader], T]) -> Iterator[T]:
+    reader = BinaryReader(data, type_code | LIST)
+    for _ in range(reader.uint()):
+        yield read(reader)
+
+
+def dump_datetime(value: Optional[datetime]) -> Optional[str]:
+    # the inverse of parse_datetime for dumps()
+    if value is None:
+        return None
+    return value.isoformat().replace('+00:00', 'Z')
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from datetime import datetime
-from dateutil.parser import isoparse
+from .timestamp import parse_datetime
+from .decode import DecodeContext
+from . import binary
 
 
 class Bonus:
@@ -42,24 +44,89 @@ class Bonus:
         self.player_name: str = player_name
 
     @staticmethod
-    def loads(data: dict[str, Any]) -> Bonus:
+    def loads(data: dict[str, Any], context: Optional[DecodeContext] = None) -> Bonus:
+        if context is None:
+            context = DecodeContext()
         deleted_on_text = data.get('deletedOn')
         if deleted_on_text is None:
             deleted_on = None
         else:
-            deleted_on = isoparse(deleted_on_text)
+            deleted_on = parse_datetime(deleted_on_text)
         return Bonus(
             id=data['id'],
             season=data['season'],
-            awarded_on=isoparse(data['awardedOn']),
+            awarded_on=parse_datetime(data['awardedOn']),
             prev_mmr=data['prevMmr'],
             new_mmr=data['newMmr'],
             amount=data['amount'],
             deleted_on=deleted_on,
             player_id=data['playerId'],
-            player_name=data['playerName']
+            player_name=context.str(data['playerName'])
         )
 
     @classmethod
-    def loads_list(cls, data: list[dict[str, Any]]) -> list[Bonus]:
-        return list(map(lambda b: cls.loads(b), data))
+    def loads_list(
+        cls,
+        data: list[dict[str, Any]],
+        context: Optional[DecodeContext] = None
+    ) -> list[Bonus]:
+        if context is None:
+            context = DecodeContext()
+        return list(map(lambda b: cls.loads(b, context=context), data))
+
+    def dumps(self) -> dict[str, Any]:
+        return {
+            'id': self.id,
+            'season': self.season,
+            'awardedOn': binary.dump_datetime(self.awarded_on),
+            'prevMmr': self.prev_mmr,
+            'newMmr': self.new_mmr,
+            'amount': self.amount,
+            'deletedOn': binary.dump_datetime(self.deleted_on),
+            'playerId': self.player_id,
+            'playerName': self.player_name
+        }
+
+    def write_binary(self, writer: binary.BinaryWriter) -> None:
+        writer.uint(self.id)
+        writer.uint(self.season)
+        writer.datetime(self.awarded_on)
+        writer.int(self.prev_mmr)
+        writer.int(self.new_mmr)
+        writer.int(self.amount)
+        writer.optional_datetime(self.deleted_on)
+        writer.uint(self.player_id)
+        writer.str(self.player_name)
+
+    @staticmethod
+    def read_binary(reader: binary.BinaryReader) -> Bonus:
+        return Bonus(
+            id=reader.uint(),
+            season=reader.uint(),
+            awarded_on=reader.datetime(),
+            prev_mmr=reader.int(),
+            new_mmr=reader.int(),
+            amount=reader.int(),
+            deleted_on=reader.optional_datetime(),
+            player_id=reader.uint(),
+            player_name=reader.str()
+        )
+
+    def to_bytes(self) -> bytes:
+        return binary.to_bytes(self, binary.BONUS)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> Bonus:
+        return binary.from_bytes(data, binary.BONUS, Bonus.read_binary)
+
+    @staticmethod
+    def to_bytes_list(values: list[Bonus]) -> bytes:
+        return binary.to_bytes_list(values, binary.BONUS)
+
+    @staticmethod
+    def from_bytes_list(data: bytes) -> list[Bonus]:
+        return binary.from_bytes_list(data, binary.BONUS, Bonus.read_binary)
+
+    @staticmethod
+    def iter_bytes_list(data: bytes) -> Iterator[Bonus]:
+        return binary.iter_bytes_list(data, binary.BONUS, Bonus.read_binary)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any, Hashable, Optional
+from collections import OrderedDict
+import time
+
+
+DEFAULT_TTLS: dict[str, float] = {
+    '/player': 300.0,
+    '/player/details': 120.0,
+    '/player/list': 600.0,
+    '/player/leaderboard': 30.0,
+    '/table': 86400.0,
+    '/table/list': 60.0,
+    '/table/unverified': 10.0,
+    '/bonus': 3600.0,
+    '/bonus/list': 120.0,
+    '/penalty': 3600.0,
+    '/penalty/list': 120.0,
+    # PlayerSanctions summaries built by LoungeClient.get_sanctions
+    '/sanctions': 120.0
+}
+
+
+class ResponseCache:
+
+    __slots__ = (
+        'maxsize',
+        'ttl',
+        'ttls',
+        'hits',
+        'misses',
+        '_entries'
+    )
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        ttls: Optional[dict[str, float]] = None
+    ) -> None:
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.ttls: dict[str, float] = dict(DEFAULT_TTLS) if ttls is None else ttls
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    @staticmethod
+    def key(path: str, params: dict[str, Any]) -> Hashable:
+        return (path, tuple(sorted((k, str(v)) for k, v in params.items())))
+
+    def ttl_for(self, path: str, value: Any) -> float:
+        # a table can still change until it is verified
+        if path == '/table' and getattr(value, 'verified_on', None) is None:
+            return self.ttls.get('/table/unverified', self.ttl)
+        return self.ttls.get(path, self.ttl)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, ttl: float) -> None:
+        if value is None or ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, path: str, params: dict[str, Any]) -> None:
+        self._entries.pop(self.key(path, params), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
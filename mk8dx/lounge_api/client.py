@@ -0,0 +1,632 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Callable, Hashable, Iterable, Optional, TypeVar, Union
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from functools import partial
+from itertools import islice
+import asyncio
+import json
+import logging
+import time
+import aiohttp
+
+from .player import Player
+from .player_details import PlayerDetails
+from .player_list import PlayerList
+from .leaderboard import Leaderboard
+from .table_details import TableDetails
+from .bonus import Bonus
+from .penalty import Penalty
+from .sanctions import PlayerSanctions
+from .cache import ResponseCache
+from .table_store import TableStore
+from .rate_limit import RateLimiter, RetryPolicy, parse_retry_after
+from .stream import iter_json_array
+from .instrumentation import RequestEvent
+from .identity import IdentityIndex
+from .decode import DecodeContext
+from .offload import load_list
+
+
+BASE_URL = 'https://www.mk8dx-lounge.com/api'
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class LoungeAPIError(Exception):
+
+    __slots__ = (
+        'status',
+        'messages'
+    )
+
+    def __init__(self, status: int, messages: list[str]) -> None:
+        self.status: int = status
+        self.messages: list[str] = messages
+
+
+class LoungeAPIThrottledError(LoungeAPIError):
+
+    __slots__ = (
+        'retry_after',
+    )
+
+    def __init__(self, status: int, messages: list[str], retry_after: Optional[float] = None) -> None:
+        super().__init__(status=status, messages=messages)
+        self.retry_after: Optional[float] = retry_after
+
+
+class LoungeClient:
+
+    __slots__ = (
+        'base_url',
+        'limit',
+        'limit_per_host',
+        'keepalive_timeout',
+        'ttl_dns_cache',
+        'timeout',
+        'cache',
+        'sanctions_cache',
+        'table_store',
+        'rate_limiter',
+        'retry',
+        'lazy',
+        'hooks',
+        'identity_index',
+        'executor',
+        'offload_threshold',
+        '_session',
+        '_inflight'
+    )
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        limit: int = 100,
+        limit_per_host: int = 16,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        timeout: Optional[float] = 30.0,
+        cache: Optional[ResponseCache] = None,
+        table_store: Optional[TableStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        lazy: bool = False,
+        hooks: Optional[list[Callable[[RequestEvent], None]]] = None,
+        identity_index: Optional[IdentityIndex] = None,
+        executor: Optional[Executor] = None,
+        offload_threshold: int = 1 << 18,
+        sanctions_cache: Optional[ResponseCache] = None
+    ) -> None:
+        self.base_url: str = base_url.rstrip('/')
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.ttl_dns_cache: Optional[int] = ttl_dns_cache
+        self.timeout: Optional[float] = timeout
+        self.cache: Optional[ResponseCache] = cache
+        # unlike the opt-in response cache this one is on by default, since a roster report
+        # otherwise refetches two lists per player every time
+        self.sanctions_cache: ResponseCache = (
+            ResponseCache() if sanctions_cache is None else sanctions_cache
+        )
+        self.table_store: Optional[TableStore] = table_store
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.retry: RetryPolicy = RetryPolicy() if retry is None else retry
+        self.lazy: bool = lazy
+        self.hooks: list[Callable[[RequestEvent], None]] = [] if hooks is None else hooks
+        self.identity_index: Optional[IdentityIndex] = identity_index
+        # list responses of at least offload_threshold bytes are decoded in the executor, which
+        # should be a ProcessPoolExecutor to keep JSON parsing off the event loop
+        self.executor: Optional[Executor] = executor
+        self.offload_threshold: int = offload_threshold
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def __aenter__(self) -> LoungeClient:
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # created lazily so that the session binds to the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=self.ttl_dns_cache is not None
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                # timeout bounds connecting and each socket read, not the whole request, so long
+                # list downloads and streams that are consumed slowly are not cut off
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=self.timeout,
+                    sock_read=self.timeout
+                )
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def _request(self, path: str, params: dict) -> AsyncIterator[Optional[aiohttp.ClientResponse]]:
+        session = self._get_session()
+        retry = self.retry
+        attempt = 0
+        response = None
+        started_at = time.perf_counter()
+        try:
+            while True:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire()
+                try:
+                    response = await session.get(self.base_url + path, params=params)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt >= retry.max_retries:
+                        raise
+                    await asyncio.sleep(retry.delay(attempt))
+                    attempt += 1
+                    continue
+                if response.status == 200:
+                    async with response:
+                        yield response
+                    return
+                async with response:
+                    text = await response.text()
+                if response.status == 404:
+                    yield None
+                    return
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                # retrying before the server asked us to would only get throttled again, so a
+                # longer Retry-After than max_delay is handed to the caller instead
+                throttled = retry_after is not None and retry_after > retry.max_delay
+                if response.status in retry.statuses and attempt < retry.max_retries and not throttled:
+                    delay = retry.delay(attempt, retry_after)
+                    if response.status == 429 and self.rate_limiter is not None:
+                        self.rate_limiter.pause(delay)
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                messages = [text] if text else []
+                if response.status == 429 and retry_after is not None and self.rate_limiter is not None:
+                    self.rate_limiter.pause(retry_after)
+                if response.status in (429, 503) or throttled:
+                    raise LoungeAPIThrottledError(
+                        status=response.status,
+                        messages=messages,
+                        retry_after=retry_after
+                    )
+                raise LoungeAPIError(status=response.status, messages=messages)
+        finally:
+            if self.hooks:
+                self._emit(RequestEvent(
+                    path=path,
+                    params=params,
+                    latency=time.perf_counter() - started_at,
+                    status=None if response is None else response.status,
+                    size=0 if response is None else response.content.total_bytes,
+                    retries=attempt
+                ))
+
+    def _emit(self, event: RequestEvent) -> None:
+        # a broken hook must not replace the result or the error of the request it observed
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                _logger.exception('request hook %r failed', hook)
+
+    async def get(self, path: str, params: dict = {}) -> Optional[dict[str, Any]]:
+        async with self._request(path=path, params=params) as response:
+            if response is None:
+                return None
+            return await response.json()
+
+    async def _iter(self, path: str, params: dict, loads: Callable[[Any], T]) -> AsyncIterator[T]:
+        async with self._request(path=path, params=params) as response:
+            if response is None:
+                return
+            async for data in iter_json_array(response.content):
+                value = loads(data)
+                if self.identity_index is not None:
+                    self.identity_index.add(value)
+                yield value
+
+    async def _fetch(
+        self,
+        path: str,
+        params: dict,
+        loads: Callable[[Any], T],
+        refresh: bool = False,
+        model: Optional[type] = None
+    ) -> Optional[T]:
+        key = ResponseCache.key(path, params)
+        if self.cache is not None and not refresh:
+            value = self.cache.get(key)
+            if value is not None:
+                if self.hooks:
+                    self._emit(RequestEvent(
+                        path=path,
+                        params=params,
+                        latency=0.0,
+                        status=200,
+                        cache_hit=True
+                    ))
+                return value
+        # identical concurrent calls share one in-flight request and its parsed result
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(
+                path=path,
+                params=params,
+                loads=loads,
+                key=key,
+                model=model
+            ))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        elif self.hooks:
+            # a joined caller sends nothing itself, but it is still a call of the endpoint
+            started_at = time.perf_counter()
+            status = None
+            try:
+                value = await asyncio.shield(task)
+                status = 404 if value is None else 200
+                return value
+            except LoungeAPIError as e:
+                status = e.status
+                raise
+            finally:
+                self._emit(RequestEvent(
+                    path=path,
+                    params=params,
+                    latency=time.perf_counter() - started_at,
+                    status=status,
+                    coalesced=True
+                ))
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        path: str,
+        params: dict,
+        loads: Callable[[Any], T],
+        key: Hashable,
+        model: Optional[type] = None
+    ) -> Optional[T]:
+        # model is the list model for responses that may be decoded in the executor
+        if self.executor is None or model is None:
+            data = await self.get(path=path, params=params)
+            if data is None:
+                return None
+            value = loads(data)
+        else:
+            async with self._request(path=path, params=params) as response:
+                if response is None:
+                    return None
+                raw = await response.read()
+            if len(raw) < self.offload_threshold:
+                value = loads(json.loads(raw))
+            else:
+                # the worker sends back finished models, so offloaded lists ignore self.lazy
+                value = await load_list(self.executor, raw, model)
+        if self.cache is not None:
+            self.cache.put(key, value, self.cache.ttl_for(path, value))
+        if self.identity_index is not None:
+            self.identity_index.add(value)
+        return value
+
+    async def get_player(
+        self,
+        id=None,
+        name=None,
+        mkc_id=None,
+        discord_id=None,
+        fc=None,
+        season=None
+    ) -> Optional[Player]:
+        params = {}
+        if id is not None:
+            params['id'] = id
+        elif name is not None:
+            params['name'] = name
+        elif mkc_id is not None:
+            params['mkcId'] = mkc_id
+        elif discord_id is not None:
+            params['discordId'] = discord_id
+        elif fc is not None:
+            params['fc'] = fc
+        else:
+            return None
+        if season is not None:
+            params['season'] = season
+        return await self._fetch(path='/player', params=params, loads=Player.loads)
+
+    async def get_player_details(self, id=None, name=None, season=None) -> Optional[PlayerDetails]:
+        params = {}
+        if id is not None:
+            params['id'] = id
+        elif name is not None:
+            params['name'] = name
+        else:
+            return None
+        if season is not None:
+            params['season'] = season
+        loads = partial(PlayerDetails.loads, lazy=self.lazy)
+        return await self._fetch(path='/player/details', params=params, loads=loads)
+
+    async def get_player_list(self, min_mmr=None, max_mmr=None, season=None) -> Optional[PlayerList]:
+        params = {}
+        if min_mmr is not None:
+            params['minMmr'] = min_mmr
+        if max_mmr is not None:
+            params['maxMmr'] = max_mmr
+        if season is not None:
+            params['season'] = season
+        return await self._fetch(path='/player/list', params=params, loads=PlayerList.loads)
+
+    async def get_leaderboard(
+        self,
+        season: int,
+        skip: int = 0,
+        page_size: int = 50,
+        search=None,
+        country=None,
+        min_mmr=None,
+        max_mmr=None,
+        min_events_played=None,
+        max_events_played=None
+    ) -> Optional[Leaderboard]:
+        params = {'season': season, 'skip': skip, 'pageSize': page_size}
+        if search is not None:
+            params['search'] = search
+        if country is not None:
+            params['country'] = country
+        if min_mmr is not None:
+            params['minMmr'] = min_mmr
+        if max_mmr is not None:
+            params['maxMmr'] = max_mmr
+        if min_events_played is not None:
+            params['minEventsPlayed'] = min_events_played
+        if max_events_played is not None:
+            params['maxEventsPlayed'] = max_events_played
+        return await self._fetch(path='/player/leaderboard', params=params, loads=Leaderboard.loads)
+
+    async def iter_leaderboard(
+        self,
+        season: int,
+        page_size: int = 100,
+        search=None,
+        country=None,
+        min_mmr=None,
+        max_mmr=None,
+        min_events_played=None,
+        max_events_played=None,
+        prefetch: int = 4
+    ) -> AsyncIterator[Leaderboard.Player]:
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1')
+
+        def get_page(skip: int) -> asyncio.Task[Optional[Leaderboard]]:
+            return asyncio.ensure_future(self.get_leaderboard(
+                season=season,
+                skip=skip,
+                page_size=page_size,
+                search=search,
+                country=country,
+                min_mmr=min_mmr,
+                max_mmr=max_mmr,
+                min_events_played=min_events_played,
+                max_events_played=max_events_played
+            ))
+
+        first_page = await get_page(0)
+        if first_page is None:
+            return
+        skips = iter(range(page_size, first_page.total_players, page_size))
+        # at least the next page must be in flight, or the loop below stops after the first one
+        pages: deque[asyncio.Task[Optional[Leaderboard]]] = deque(
+            map(get_page, islice(skips, max(prefetch, 1)))
+        )
+        try:
+            for player in first_page.data:
+                yield player
+            while pages:
+                page = await pages.popleft()
+                pages.extend(map(get_page, islice(skips, 1)))
+                if page is None or not page.data:
+                    return
+                for player in page.data:
+                    yield player
+        finally:
+            for task in pages:
+                task.cancel()
+
+    async def get_table(self, table_id: int, refresh: bool = False) -> Optional[TableDetails]:
+        store = self.table_store
+        if store is not None and not refresh:
+            table = store.get(table_id)
+            if table is not None and TableStore.is_immutable(table):
+                if self.hooks:
+                    self._emit(RequestEvent(
+                        path='/table',
+                        params={'tableId': table_id},
+                        latency=0.0,
+                        status=200,
+                        cache_hit=True
+                    ))
+                return table
+        params = {'tableId': table_id}
+        loads = partial(TableDetails.loads, lazy=self.lazy)
+        table = await self._fetch(path='/table', params=params, loads=loads, refresh=refresh)
+        if store is not None and table is not None and TableStore.is_immutable(table):
+            store.put(table)
+        return table
+
+    async def get_tables(
+        self,
+        table_ids: Iterable[int],
+        concurrency: int = 8,
+        refresh: bool = False
+    ) -> list[Union[TableDetails, None, BaseException]]:
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        table_ids = list(table_ids)
+        unique_ids = list(dict.fromkeys(table_ids))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_table(table_id: int) -> Optional[TableDetails]:
+            async with semaphore:
+                return await self.get_table(table_id=table_id, refresh=refresh)
+
+        results = await asyncio.gather(*map(get_table, unique_ids), return_exceptions=True)
+        results_by_id = dict(zip(unique_ids, results))
+        return [results_by_id[table_id] for table_id in table_ids]
+
+    async def get_list(self, after=None, before=None, season=None) -> Optional[list[TableDetails]]:
+        params = {}
+        if after is not None:
+            params['from'] = after
+        if before is not None:
+            params['to'] = before
+        if season is not None:
+            params['season'] = season
+        loads = partial(TableDetails.loads_list, lazy=self.lazy)
+        tables = await self._fetch(path='/table/list', params=params, loads=loads, model=TableDetails)
+        if self.table_store is not None and tables is not None:
+            self.table_store.put_many(filter(TableStore.is_immutable, tables))
+        return tables
+
+    async def iter_list(self, after=None, before=None, season=None) -> AsyncIterator[TableDetails]:
+        params = {}
+        if after is not None:
+            params['from'] = after
+        if before is not None:
+            params['to'] = before
+        if season is not None:
+            params['season'] = season
+        # one context for the whole stream, like loads_list
+        loads = partial(TableDetails.loads, lazy=self.lazy, context=DecodeContext())
+        async for table in self._iter(path='/table/list', params=params, loads=loads):
+            if self.table_store is not None and TableStore.is_immutable(table):
+                self.table_store.put(table)
+            yield table
+
+    async def get_table_unverified(self, season=None) -> Optional[list[TableDetails]]:
+        params = {}
+        if season is not None:
+            params['season'] = season
+        loads = partial(TableDetails.loads_list, lazy=self.lazy)
+        return await self._fetch(
+            path='/table/unverified',
+            params=params,
+            loads=loads,
+            model=TableDetails
+        )
+
+    async def iter_table_unverified(self, season=None) -> AsyncIterator[TableDetails]:
+        params = {}
+        if season is not None:
+            params['season'] = season
+        loads = partial(TableDetails.loads, lazy=self.lazy, context=DecodeContext())
+        async for table in self._iter(path='/table/unverified', params=params, loads=loads):
+            yield table
+
+    async def get_bonus(self, id: int) -> Optional[Bonus]:
+        params = {'id': id}
+        return await self._fetch(path='/bonus', params=params, loads=Bonus.loads)
+
+    async def get_bonus_list(
+        self,
+        name: str,
+        season=None
+    ) -> Optional[list[Bonus]]:
+        params = {'name': name}
+        if season is not None:
+            params['season'] = season
+        return await self._fetch(path='/bonus/list', params=params, loads=Bonus.loads_list)
+
+    async def get_penalty(self, id: int) -> Optional[Penalty]:
+        params = {'id': id}
+        return await self._fetch(path='/penalty', params=params, loads=Penalty.loads)
+
+    async def get_penalty_list(
+        self,
+        name: str,
+        is_strike: Optional[bool] = None,
+        after=None,
+        include_deleted=False,
+        season=None
+    ) -> Optional[list[Penalty]]:
+        params = {'name': name, 'includeDeleted': str(include_deleted)}
+        if is_strike is not None:
+            params['isStrike'] = str(is_strike)
+        if after is not None:
+            params['from'] = after
+        if season is not None:
+            params['season'] = season
+        return await self._fetch(path='/penalty/list', params=params, loads=Penalty.loads_list)
+
+    async def get_sanctions(
+        self,
+        names: Iterable[str],
+        season=None,
+        include_deleted=False,
+        concurrency: int = 8
+    ) -> dict[str, Union[PlayerSanctions, None, BaseException]]:
+        # summaries are cached by name, season and include_deleted in sanctions_cache
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        unique_names = list(dict.fromkeys(names))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_penalty_list(name: str) -> Optional[list[Penalty]]:
+            async with semaphore:
+                return await self.get_penalty_list(
+                    name=name,
+                    include_deleted=include_deleted,
+                    season=season
+                )
+
+        async def get_bonus_list(name: str) -> Optional[list[Bonus]]:
+            async with semaphore:
+                return await self.get_bonus_list(name=name, season=season)
+
+        async def get_sanctions(name: str) -> Optional[PlayerSanctions]:
+            params = {'name': name, 'season': season, 'includeDeleted': include_deleted}
+            key = ResponseCache.key('/sanctions', params)
+            sanctions = self.sanctions_cache.get(key)
+            if sanctions is not None:
+                return sanctions
+            penalties, bonuses = await asyncio.gather(get_penalty_list(name), get_bonus_list(name))
+            if penalties is None and bonuses is None:
+                return None
+            sanctions = PlayerSanctions(
+                name=name,
+                season=season,
+                penalties=penalties or [],
+                bonuses=bonuses or []
+            )
+            cache = self.sanctions_cache
+            cache.put(key, sanctions, cache.ttl_for('/sanctions', sanctions))
+            return sanctions
+
+        results = await asyncio.gather(*map(get_sanctions, unique_names), return_exceptions=True)
+        return dict(zip(unique_names, results))
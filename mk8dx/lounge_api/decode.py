@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Optional
+
+
+class DecodeContext:
+
+    # json.loads creates a new str for every occurrence, so a season of tables holds thousands of
+    # copies of the same player names, tiers and country codes; the context keeps one of each
+    __slots__ = (
+        '_strings'
+    )
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def str(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
@@ -0,0 +1,486 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+from datetime import datetime, timedelta, timezone
+import argparse
+import asyncio
+import random
+from aiohttp import web
+
+from .player import Player
+from .player_details import PlayerDetails
+from .player_list import PlayerList
+from .leaderboard import Leaderboard
+from .table_details import TableDetails
+from .bonus import Bonus
+from .penalty import Penalty
+
+
+_COUNTRY_CODES = ('JP', 'US', 'CA', 'GB', 'FR', 'DE', 'ES', 'IT', 'NL', 'AU', 'MX', 'BR', 'KR')
+_TIERS = ('X', 'S', 'A', 'AB', 'B', 'BC', 'C', 'CD', 'D', 'DE', 'E', 'EF', 'F', 'SQ')
+_TEAM_SIZES = (1, 2, 3, 4, 6)
+_RACE_POINTS = (15, 12, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1)
+_DIVISIONS = ('Iron', 'Bronze', 'Silver', 'Gold', 'Platinum', 'Sapphire', 'Ruby', 'Diamond')
+
+
+def _timestamp(time: datetime) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%S.%f') + 'Z'
+
+
+def _rank(mmr: Optional[int]) -> dict[str, Any]:
+    if mmr is None:
+        return {'division': 'Placement'}
+    if mmr >= 17000:
+        return {'division': 'Grandmaster'}
+    if mmr >= 16000:
+        return {'division': 'Master'}
+    division = max(0, min(mmr // 2000, len(_DIVISIONS) - 1))
+    return {'division': _DIVISIONS[division], 'level': 1 if mmr < division * 2000 + 1000 else 2}
+
+
+def _rank_name(mmr: Optional[int]) -> str:
+    rank = _rank(mmr)
+    if 'level' in rank:
+        return f"{rank['division']} {rank['level']}"
+    return rank['division']
+
+
+class FakeLoungeData:
+
+    __slots__ = (
+        'season',
+        'players',
+        'tables',
+        'penalties',
+        'bonuses',
+        '_players_by_name',
+        '_mmr_changes'
+    )
+
+    def __init__(
+        self,
+        num_players: int = 2000,
+        num_tables: int = 5000,
+        season: int = 8,
+        seed: int = 0
+    ) -> None:
+        random_ = random.Random(seed)
+        self.season: int = season
+        self.players: list[dict[str, Any]] = []
+        self.tables: list[dict[str, Any]] = []
+        self.penalties: list[dict[str, Any]] = []
+        self.bonuses: list[dict[str, Any]] = []
+        self._players_by_name: dict[str, dict[str, Any]] = {}
+        self._mmr_changes: dict[int, list[dict[str, Any]]] = {}
+        for id in range(1, num_players + 1):
+            mmr = max(0, min(20000, int(random_.gauss(6000, 3000))))
+            player = {
+                'id': id,
+                'name': f'Player{id}',
+                'mkcId': 10000 + id,
+                'discordId': str(100000000000000000 + id),
+                'countryCode': random_.choice(_COUNTRY_CODES),
+                'switchFc': '-'.join(f'{random_.randrange(10000):04d}' for _ in range(3)),
+                'isHidden': False,
+                'mmr': mmr,
+                'maxMmr': mmr + random_.randrange(1000),
+                'eventsPlayed': 0
+            }
+            self.players.append(player)
+            self._players_by_name[player['name'].lower()] = player
+            self._mmr_changes[id] = []
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        for id in range(1, num_tables + 1):
+            self.tables.append(self._generate_table(random_, id, start + timedelta(minutes=10 * id)))
+        for id in range(1, num_players // 10 + 1):
+            player = random_.choice(self.players)
+            awarded_on = start + timedelta(minutes=random_.randrange(10 * num_tables))
+            is_strike = random_.random() < 0.5
+            amount = -random_.choice((50, 100, 150)) if is_strike else -random_.choice((5, 10, 25))
+            self.penalties.append(self._adjustment(id, player, awarded_on, amount, is_strike=is_strike))
+            awarded_on = start + timedelta(minutes=random_.randrange(10 * num_tables))
+            self.bonuses.append(self._adjustment(id, random_.choice(self.players), awarded_on, 50))
+
+    def _adjustment(
+        self,
+        id: int,
+        player: dict[str, Any],
+        awarded_on: datetime,
+        amount: int,
+        is_strike: Optional[bool] = None
+    ) -> dict[str, Any]:
+        adjustment = {
+            'id': id,
+            'season': self.season,
+            'awardedOn': _timestamp(awarded_on),
+            'prevMmr': player['mmr'],
+            'newMmr': player['mmr'] + amount,
+            'amount': amount,
+            'deletedOn': None,
+            'playerId': player['id'],
+            'playerName': player['name']
+        }
+        if is_strike is not None:
+            adjustment['isStrike'] = is_strike
+        return adjustment
+
+    def _generate_table(self, random_: random.Random, id: int, created_on: datetime) -> dict[str, Any]:
+        team_size = random_.choice(_TEAM_SIZES)
+        num_teams = 12 // team_size
+        players = random_.sample(self.players, 12)
+        points = [0] * 12
+        for _ in range(12):
+            for position, player_index in enumerate(random_.sample(range(12), 12)):
+                points[player_index] += _RACE_POINTS[position]
+        teams = []
+        for team_index in range(num_teams):
+            members = range(team_index * team_size, (team_index + 1) * team_size)
+            teams.append({'scores': [(players[i], points[i]) for i in members]})
+        teams.sort(key=lambda t: -sum(score for _, score in t['scores']))
+        verified = random_.random() < 0.97
+        deleted = random_.random() < 0.01
+        tier = random_.choice(_TIERS)
+        for rank, team in enumerate(teams, start=1):
+            delta = (num_teams + 1 - 2 * rank) * 15
+            scores = []
+            for player, score in team['scores']:
+                score_data = {
+                    'score': score,
+                    'multiplier': 1.0,
+                    'prevMmr': player['mmr'],
+                    'newMmr': player['mmr'] + delta,
+                    'delta': delta,
+                    'playerId': player['id'],
+                    'playerName': player['name'],
+                    'playerDiscordId': player['discordId'],
+                    'playerCountryCode': player['countryCode']
+                }
+                scores.append(score_data)
+                if verified and not deleted:
+                    player['mmr'] += delta
+                    player['maxMmr'] = max(player['maxMmr'], player['mmr'])
+                    player['eventsPlayed'] += 1
+                    self._mmr_changes[player['id']].append({
+                        'changeId': id,
+                        'newMmr': player['mmr'],
+                        'mmrDelta': delta,
+                        'reason': 'Table',
+                        'time': _timestamp(created_on),
+                        'score': score,
+                        'partnerScores': [s for p, s in team['scores'] if p is not player],
+                        'partnerIds': [p['id'] for p, _ in team['scores'] if p is not player],
+                        'rank': rank,
+                        'tier': tier,
+                        'numTeams': num_teams
+                    })
+            team['rank'] = rank
+            team['scores'] = scores
+        return {
+            'id': id,
+            'season': self.season,
+            'createdOn': _timestamp(created_on),
+            'verifiedOn': _timestamp(created_on + timedelta(minutes=5)) if verified else None,
+            'deletedOn': _timestamp(created_on + timedelta(minutes=30)) if deleted else None,
+            'numTeams': num_teams,
+            'url': f'/TableImage/{id}.png',
+            'tier': tier,
+            'teams': teams,
+            'tableMessageId': str(200000000000000000 + id),
+            'updateMessageId': str(300000000000000000 + id),
+            'authorId': str(100000000000000000 + players[0]['id'])
+        }
+
+    def find_player(self, query: dict[str, str]) -> Optional[dict[str, Any]]:
+        if 'id' in query:
+            index = int(query['id']) - 1
+            return self.players[index] if 0 <= index < len(self.players) else None
+        if 'name' in query:
+            return self._players_by_name.get(query['name'].lower())
+        for key, field in (('mkcId', 'mkcId'), ('discordId', 'discordId'), ('fc', 'switchFc')):
+            if key in query:
+                value = query[key]
+                for player in self.players:
+                    if str(player[field]) == value:
+                        return player
+                return None
+        return None
+
+    def player_details(self, player: dict[str, Any]) -> dict[str, Any]:
+        changes = self._mmr_changes[player['id']]
+        last_ten = changes[-10:]
+        wins = sum(1 for c in last_ten if c['mmrDelta'] > 0)
+        scores = [c['score'] for c in changes]
+        return {
+            'playerId': player['id'],
+            'name': player['name'],
+            'mkcId': player['mkcId'],
+            'countryCode': player['countryCode'],
+            'switchFc': player['switchFc'],
+            'isHidden': player['isHidden'],
+            'season': self.season,
+            'mmr': player['mmr'],
+            'maxMmr': player['maxMmr'],
+            'eventsPlayed': player['eventsPlayed'],
+            'winRate': sum(1 for c in changes if c['mmrDelta'] > 0) / len(changes) if changes else None,
+            'winsLastTen': wins,
+            'lossesLastTen': len(last_ten) - wins,
+            'gainLossLastTen': sum(c['mmrDelta'] for c in last_ten),
+            'averageScore': sum(scores) / len(scores) if scores else None,
+            'mmrChanges': changes[::-1],
+            'nameHistory': [],
+            'rank': _rank_name(player['mmr'])
+        }
+
+    def leaderboard_player(self, player: dict[str, Any], overall_rank: int) -> dict[str, Any]:
+        return {
+            'id': player['id'],
+            'overallRank': overall_rank,
+            'countryCode': player['countryCode'],
+            'name': player['name'],
+            'mmr': player['mmr'],
+            'maxMmr': player['maxMmr'],
+            'winsLastTen': 0,
+            'lossesLastTen': 0,
+            'eventsPlayed': player['eventsPlayed'],
+            'mmrRank': _rank(player['mmr']),
+            'maxMmrRank': _rank(player['maxMmr'])
+        }
+
+    def models(self, num_details: Optional[int] = None) -> dict[str, tuple[type, list[Any]]]:
+        # decoded samples of every model, shared by the serialization tests and benchmark;
+        # num_details limits the players whose details are built, which is the slow part
+        players = sorted(self.players, key=lambda p: -p['mmr'])
+        return {
+            'Player': (Player, [Player.loads(p) for p in self.players]),
+            'PlayerDetails': (PlayerDetails, [
+                PlayerDetails.loads(self.player_details(p)) for p in self.players[:num_details]
+            ]),
+            'PlayerList': (PlayerList, [PlayerList.loads({'players': [
+                {
+                    'name': p['name'],
+                    'mkcId': p['mkcId'],
+                    'mmr': p['mmr'],
+                    'discordId': p['discordId'],
+                    'eventsPlayed': p['eventsPlayed']
+                }
+                for p in self.players
+            ]})]),
+            'Leaderboard': (Leaderboard, [Leaderboard.loads({
+                'totalPlayers': len(players),
+                'data': [self.leaderboard_player(p, rank) for rank, p in enumerate(players, start=1)]
+            })]),
+            'TableDetails': (TableDetails, TableDetails.loads_list(self.tables)),
+            'Penalty': (Penalty, Penalty.loads_list(self.penalties)),
+            'Bonus': (Bonus, Bonus.loads_list(self.bonuses))
+        }
+
+
+class FakeLoungeServer:
+
+    __slots__ = (
+        'data',
+        'latency',
+        'jitter',
+        'error_rate',
+        'throttle_rate',
+        'requests',
+        '_random',
+        '_runner',
+        '_base_url'
+    )
+
+    def __init__(
+        self,
+        data: Optional[FakeLoungeData] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0
+    ) -> None:
+        self.data: FakeLoungeData = FakeLoungeData(seed=seed) if data is None else data
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.error_rate: float = error_rate
+        self.throttle_rate: float = throttle_rate
+        self.requests: int = 0
+        self._random: random.Random = random.Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+        self._base_url: Optional[str] = None
+
+    async def __aenter__(self) -> FakeLoungeServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    @property
+    def base_url(self) -> str:
+        if self._base_url is None:
+            raise RuntimeError('the server has not been started')
+        return self._base_url
+
+    def application(self) -> web.Application:
+        application = web.Application(middlewares=[self._middleware])
+        application.router.add_get('/api/player', self._player)
+        application.router.add_get('/api/player/details', self._player_details)
+        application.router.add_get('/api/player/list', self._player_list)
+        application.router.add_get('/api/player/leaderboard', self._leaderboard)
+        application.router.add_get('/api/table', self._table)
+        application.router.add_get('/api/table/list', self._table_list)
+        application.router.add_get('/api/table/unverified', self._table_unverified)
+        application.router.add_get('/api/bonus', self._bonus)
+        application.router.add_get('/api/bonus/list', self._bonus_list)
+        application.router.add_get('/api/penalty', self._penalty)
+        application.router.add_get('/api/penalty/list', self._penalty_list)
+        return application
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        self._runner = web.AppRunner(self.application())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        # port 0 lets the OS pick a free port
+        bound_port = self._runner.addresses[0][1]
+        self._base_url = f'http://{host}:{bound_port}/api'
+        return self._base_url
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+        self._runner = None
+        self._base_url = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        self.requests += 1
+        if self.latency > 0 or self.jitter > 0:
+            await asyncio.sleep(max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter)))
+        roll = self._random.random()
+        if roll < self.throttle_rate:
+            return web.Response(status=429, text='Too many requests', headers={'Retry-After': '1'})
+        if roll < self.throttle_rate + self.error_rate:
+            return web.Response(status=503, text='Service unavailable')
+        return await handler(request)
+
+    @staticmethod
+    def _by_id(items: list[dict[str, Any]], request: web.Request, key: str = 'id') -> web.Response:
+        try:
+            index = int(request.query[key]) - 1
+        except (KeyError, ValueError):
+            return web.Response(status=400, text=f'{key} is required')
+        if not 0 <= index < len(items):
+            return web.Response(status=404, text='Not found')
+        return web.json_response(items[index])
+
+    @staticmethod
+    def _by_player_name(items: list[dict[str, Any]], request: web.Request) -> list[dict[str, Any]]:
+        name = request.query.get('name', '').lower()
+        return [item for item in items if item['playerName'].lower() == name]
+
+    @staticmethod
+    def _date_range(request: web.Request, tables: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        def parse(text: str) -> datetime:
+            return datetime.fromisoformat(text.replace('Z', '+00:00'))
+
+        after = request.query.get('from')
+        before = request.query.get('to')
+        if after is not None:
+            after_time = parse(after)
+            tables = [t for t in tables if parse(t['createdOn']) >= after_time]
+        if before is not None:
+            before_time = parse(before)
+            tables = [t for t in tables if parse(t['createdOn']) < before_time]
+        return tables
+
+    async def _player(self, request: web.Request) -> web.Response:
+        player = self.data.find_player(request.query)
+        if player is None:
+            return web.Response(status=404, text='Player not found')
+        return web.json_response(player)
+
+    async def _player_details(self, request: web.Request) -> web.Response:
+        player = self.data.find_player(request.query)
+        if player is None:
+            return web.Response(status=404, text='Player not found')
+        return web.json_response(self.data.player_details(player))
+
+    async def _player_list(self, request: web.Request) -> web.Response:
+        min_mmr = int(request.query.get('minMmr', -(1 << 31)))
+        max_mmr = int(request.query.get('maxMmr', 1 << 31))
+        return web.json_response({'players': [
+            {
+                'name': p['name'],
+                'mkcId': p['mkcId'],
+                'mmr': p['mmr'],
+                'discordId': p['discordId'],
+                'eventsPlayed': p['eventsPlayed']
+            }
+            for p in self.data.players
+            if min_mmr <= p['mmr'] <= max_mmr
+        ]})
+
+    async def _leaderboard(self, request: web.Request) -> web.Response:
+        skip = int(request.query.get('skip', 0))
+        page_size = int(request.query.get('pageSize', 50))
+        players = sorted(self.data.players, key=lambda p: -p['mmr'])
+        return web.json_response({
+            'totalPlayers': len(players),
+            'data': [
+                self.data.leaderboard_player(player, overall_rank)
+                for overall_rank, player in enumerate(players[skip:skip + page_size], start=skip + 1)
+            ]
+        })
+
+    async def _table(self, request: web.Request) -> web.Response:
+        return self._by_id(self.data.tables, request, key='tableId')
+
+    async def _table_list(self, request: web.Request) -> web.Response:
+        return web.json_response(self._date_range(request, self.data.tables))
+
+    async def _table_unverified(self, request: web.Request) -> web.Response:
+        return web.json_response([t for t in self.data.tables if t['verifiedOn'] is None])
+
+    async def _bonus(self, request: web.Request) -> web.Response:
+        return self._by_id(self.data.bonuses, request)
+
+    async def _bonus_list(self, request: web.Request) -> web.Response:
+        return web.json_response(self._by_player_name(self.data.bonuses, request))
+
+    async def _penalty(self, request: web.Request) -> web.Response:
+        return self._by_id(self.data.penalties, request)
+
+    async def _penalty_list(self, request: web.Request) -> web.Response:
+        penalties = self._by_player_name(self.data.penalties, request)
+        if 'isStrike' in request.query:
+            is_strike = request.query['isStrike'] == 'True'
+            penalties = [p for p in penalties if p['isStrike'] == is_strike]
+        return web.json_response(penalties)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Serve generated Lounge API data locally.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--players', type=int, default=2000)
+    parser.add_argument('--tables', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    server = FakeLoungeServer(
+        data=FakeLoungeData(num_players=args.players, num_tables=args.tables, seed=args.seed),
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        seed=args.seed
+    )
+    web.run_app(server.application(), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+import json
+
+from .player import Player
+from .player_details import PlayerDetails
+from .player_list import PlayerList
+from .leaderboard import Leaderboard
+from .table_details import TableDetails
+
+if TYPE_CHECKING:
+    from .client import LoungeClient
+
+
+class IdentityIndex:
+
+    # keys are (kind, value) with kind one of 'name', 'mkc', 'discord' and 'fc'; names are
+    # case-insensitive on the Lounge so they are stored lower-cased
+    __slots__ = (
+        '_ids',
+        '_mkc_ids'
+    )
+
+    def __init__(self) -> None:
+        self._ids: dict[tuple[str, str], int] = {}
+        self._mkc_ids: dict[tuple[str, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(set(self._ids.values()))
+
+    @staticmethod
+    def _keys(
+        name: Optional[str] = None,
+        mkc_id: Optional[int] = None,
+        discord_id: Optional[str] = None,
+        fc: Optional[str] = None
+    ) -> list[tuple[str, str]]:
+        keys = []
+        if name is not None:
+            keys.append(('name', name.lower()))
+        if mkc_id is not None:
+            keys.append(('mkc', str(mkc_id)))
+        if discord_id is not None:
+            keys.append(('discord', str(discord_id)))
+        if fc is not None:
+            keys.append(('fc', fc))
+        return keys
+
+    def _link(self, player_id: int, **identifiers: Any) -> None:
+        for key in self._keys(**identifiers):
+            self._ids[key] = player_id
+
+    def add(self, value: Any) -> None:
+        if isinstance(value, Player):
+            self._link(
+                value.id,
+                name=value.name,
+                mkc_id=value.mkc_id,
+                discord_id=value.discord_id,
+                fc=value.switch_fc
+            )
+        elif isinstance(value, PlayerDetails):
+            self._link(value.player_id, name=value.name, mkc_id=value.mkc_id, fc=value.switch_fc)
+            for name in value.former_names:
+                # a former name may since have been taken by someone else
+                self._ids.setdefault(('name', name.lower()), value.player_id)
+        elif isinstance(value, Leaderboard.Player):
+            self._link(value.id, name=value.name)
+        elif isinstance(value, PlayerList.Player):
+            # list entries carry no player id, so they resolve through the MKC id
+            for key in self._keys(name=value.name, discord_id=value.discord_id):
+                self._mkc_ids[key] = value.mkc_id
+        elif isinstance(value, TableDetails):
+            for *_, player_id, player_name, player_discord_id, _country_code in value.score_rows():
+                self._link(player_id, name=player_name, discord_id=player_discord_id)
+        elif isinstance(value, (PlayerList, Leaderboard)):
+            self.add_all(value.players if isinstance(value, PlayerList) else value.data)
+        elif isinstance(value, list):
+            self.add_all(value)
+
+    def add_all(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.add(value)
+
+    def resolve(
+        self,
+        id: Optional[int] = None,
+        name: Optional[str] = None,
+        mkc_id: Optional[int] = None,
+        discord_id: Optional[str] = None,
+        fc: Optional[str] = None
+    ) -> Optional[int]:
+        if id is not None:
+            return id
+        for key in self._keys(name=name, mkc_id=mkc_id, discord_id=discord_id, fc=fc):
+            player_id = self._ids.get(key)
+            if player_id is not None:
+                return player_id
+            mkc = self._mkc_ids.get(key)
+            if mkc is not None:
+                player_id = self._ids.get(('mkc', str(mkc)))
+                if player_id is not None:
+                    return player_id
+        return None
+
+    async def lookup(
+        self,
+        client: LoungeClient,
+        name: Optional[str] = None,
+        mkc_id: Optional[int] = None,
+        discord_id: Optional[str] = None,
+        fc: Optional[str] = None
+    ) -> Optional[int]:
+        player_id = self.resolve(name=name, mkc_id=mkc_id, discord_id=discord_id, fc=fc)
+        if player_id is not None:
+            return player_id
+        player = await client.get_player(name=name, mkc_id=mkc_id, discord_id=discord_id, fc=fc)
+        if player is None:
+            return None
+        self.add(player)
+        return player.id
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump({
+                'ids': [[kind, value, id] for (kind, value), id in self._ids.items()],
+                'mkcIds': [[kind, value, mkc_id] for (kind, value), mkc_id in self._mkc_ids.items()]
+            }, f)
+
+    @staticmethod
+    def load(path: str) -> IdentityIndex:
+        with open(path) as f:
+            data = json.load(f)
+        index = IdentityIndex()
+        index._ids = {(kind, value): id for kind, value, id in data['ids']}
+        index._mkc_ids = {(kind, value): mkc_id for kind, value, mkc_id in data['mkcIds']}
+        return index
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+from bisect import bisect_left
+
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf')
+)
+
+
+class RequestEvent:
+
+    __slots__ = (
+        'path',
+        'params',
+        'status',
+        'latency',
+        'size',
+        'retries',
+        'cache_hit',
+        'coalesced'
+    )
+
+    def __init__(
+        self,
+        path: str,
+        params: dict[str, Any],
+        latency: float,
+        status: Optional[int] = None,
+        size: int = 0,
+        retries: int = 0,
+        cache_hit: bool = False,
+        coalesced: bool = False
+    ) -> None:
+        self.path: str = path
+        self.params: dict[str, Any] = params
+        self.status: Optional[int] = status
+        self.latency: float = latency
+        self.size: int = size
+        self.retries: int = retries
+        self.cache_hit: bool = cache_hit
+        # joined an identical request already in flight, whose own event carries the latency
+        self.coalesced: bool = coalesced
+
+    @property
+    def is_error(self) -> bool:
+        return not self.cache_hit and not self.coalesced and self.status not in (200, 404)
+
+
+class EndpointMetrics:
+
+    __slots__ = (
+        'requests',
+        'errors',
+        'cache_hits',
+        'coalesced',
+        'retries',
+        'bytes',
+        'latency_sum',
+        'latency_max',
+        'latency_histogram',
+        'statuses'
+    )
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.errors: int = 0
+        self.cache_hits: int = 0
+        self.coalesced: int = 0
+        self.retries: int = 0
+        self.bytes: int = 0
+        self.latency_sum: float = 0.0
+        self.latency_max: float = 0.0
+        self.latency_histogram: list[int] = [0] * len(LATENCY_BUCKETS)
+        self.statuses: dict[Optional[int], int] = {}
+
+    @property
+    def sent(self) -> int:
+        return self.requests - self.cache_hits - self.coalesced
+
+    @property
+    def latency_mean(self) -> Optional[float]:
+        sent = self.sent
+        if sent == 0:
+            return None
+        return self.latency_sum / sent
+
+    def latency_quantile(self, q: float) -> Optional[float]:
+        # upper bound of the histogram bucket containing the q-quantile
+        sent = self.sent
+        if sent == 0:
+            return None
+        rank = q * sent
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.latency_histogram):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.latency_max)
+        return self.latency_max
+
+    def add(self, event: RequestEvent) -> None:
+        self.requests += 1
+        if event.cache_hit:
+            self.cache_hits += 1
+            return
+        if event.coalesced:
+            self.coalesced += 1
+            return
+        if event.is_error:
+            self.errors += 1
+        self.retries += event.retries
+        self.bytes += event.size
+        self.latency_sum += event.latency
+        if self.latency_max < event.latency:
+            self.latency_max = event.latency
+        self.latency_histogram[bisect_left(LATENCY_BUCKETS, event.latency)] += 1
+        self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+
+
+class RequestMetrics:
+
+    __slots__ = (
+        'endpoints'
+    )
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        metrics = self.endpoints.get(event.path)
+        if metrics is None:
+            metrics = self.endpoints[event.path] = EndpointMetrics()
+        metrics.add(event)
+
+    def reset(self) -> None:
+        self.endpoints.clear()
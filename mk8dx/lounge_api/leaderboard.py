@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Optional, Any
 from .rank import Rank
+from .decode import DecodeContext
+from . import binary
 
 
 class Leaderboard:
@@ -20,12 +22,38 @@ class Leaderboard:
         self.data: list[Leaderboard.Player] = data
 
     @staticmethod
-    def loads(data: dict[str, Any]) -> Leaderboard:
+    def loads(data: dict[str, Any], context: Optional[DecodeContext] = None) -> Leaderboard:
         return Leaderboard(
             total_players=data['totalPlayers'],
-            data=Leaderboard.Player.loads_list(data=data.get('data'))
+            data=Leaderboard.Player.loads_list(data=data.get('data'), context=context)
         )
 
+    def dumps(self) -> dict[str, Any]:
+        return {
+            'totalPlayers': self.total_players,
+            'data': [player.dumps() for player in self.data]
+        }
+
+    def write_binary(self, writer: binary.BinaryWriter) -> None:
+        writer.uint(self.total_players)
+        writer.uint(len(self.data))
+        for player in self.data:
+            player.write_binary(writer)
+
+    @staticmethod
+    def read_binary(reader: binary.BinaryReader) -> Leaderboard:
+        return Leaderboard(
+            total_players=reader.uint(),
+            data=[Leaderboard.Player.read_binary(reader) for _ in range(reader.uint())]
+        )
+
+    def to_bytes(self) -> bytes:
+        return binary.to_bytes(self, binary.LEADERBOARD)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> Leaderboard:
+        return binary.from_bytes(data, binary.LEADERBOARD, Leaderboard.read_binary)
+
     class Player:
 
         __slots__ = (
@@ -81,7 +109,9 @@ class Leaderboard:
             self.max_mmr_rank: Optional[Rank] = max_mmr_rank
 
         @staticmethod
-        def laods(data: dict[str, Any]) -> Leaderboard.Player:
+        def laods(data: dict[str, Any], context: Optional[DecodeContext] = None) -> Leaderboard.Player:
+            if context is None:
+                context = DecodeContext()
             mmr_rank_data = data.get('mmrRank')
             max_mmr_rank_data = data.get('maxMmrRank')
             if mmr_rank_data is None:
@@ -95,7 +125,7 @@ class Leaderboard:
             return Leaderboard.Player(
                 id=data['id'],
                 overall_rank=data.get('overallRank'),
-                country_code=data.get('countryCode'),
+                country_code=context.str(data.get('countryCode')),
                 name=data['name'],
                 mmr=data.get('mmr'),
                 max_mmr=data.get('maxMmr'),
@@ -111,5 +141,69 @@ class Leaderboard:
             )
 
         @classmethod
-        def loads_list(cls, data: list[dict[str, Any]]) -> list[Leaderboard.Player]:
-            return list(map(lambda p: cls.laods(data=p), data))
+        def loads_list(
+            cls,
+            data: list[dict[str, Any]],
+            context: Optional[DecodeContext] = None
+        ) -> list[Leaderboard.Player]:
+            if context is None:
+                context = DecodeContext()
+            return list(map(lambda p: cls.laods(data=p, context=context), data))
+
+        def dumps(self) -> dict[str, Any]:
+            return {
+                'id': self.id,
+                'overallRank': self.overall_rank,
+                'countryCode': self.country_code,
+                'name': self.name,
+                'mmr': self.mmr,
+                'maxMmr': self.max_mmr,
+                'winRate': self.win_rate,
+                'winsLastTen': self.wins_last_ten,
+                'lossesLastTen': self.losses_last_ten,
+                'gainLossLastTen': self.gain_loss_last_ten,
+                'eventsPlayed': self.events_played,
+                'largestGain': self.largest_gain,
+                'largestLoss': self.largest_loss,
+                'mmrRank': None if self.mmr_rank is None else self.mmr_rank.dumps(),
+                'maxMmrRank': None if self.max_mmr_rank is None else self.max_mmr_rank.dumps()
+            }
+
+        def write_binary(self, writer: binary.BinaryWriter) -> None:
+            writer.uint(self.id)
+            writer.optional_int(self.overall_rank)
+            writer.optional_str(self.country_code)
+            writer.str(self.name)
+            writer.optional_int(self.mmr)
+            writer.optional_int(self.max_mmr)
+            writer.optional_float(self.win_rate)
+            writer.uint(self.wins_last_ten)
+            writer.uint(self.losses_last_ten)
+            writer.optional_int(self.gain_loss_last_ten)
+            writer.uint(self.events_played)
+            writer.optional_int(self.largest_gain)
+            writer.optional_int(self.largest_loss)
+            for rank in (self.mmr_rank, self.max_mmr_rank):
+                writer.bool(rank is not None)
+                if rank is not None:
+                    rank.write_binary(writer)
+
+        @staticmethod
+        def read_binary(reader: binary.BinaryReader) -> Leaderboard.Player:
+            return Leaderboard.Player(
+                id=reader.uint(),
+                overall_rank=reader.optional_int(),
+                country_code=reader.optional_str(),
+                name=reader.str(),
+                mmr=reader.optional_int(),
+                max_mmr=reader.optional_int(),
+                win_rate=reader.optional_float(),
+                wins_last_ten=reader.uint(),
+                losses_last_ten=reader.uint(),
+                gain_loss_last_ten=reader.optional_int(),
+                events_played=reader.uint(),
+                largest_gain=reader.optional_int(),
+                largest_loss=reader.optional_int(),
+                mmr_rank=Rank.read_binary(reader) if reader.bool() else None,
+                max_mmr_rank=Rank.read_binary(reader) if reader.bool() else None
+            )
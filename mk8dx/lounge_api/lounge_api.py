@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Optional
-import aiohttp
+from typing import Any, AsyncGenerator, AsyncIterator, Iterable, Optional, Union
+from contextlib import aclosing
+import asyncio
 
 from .player import Player
 from .player_details import PlayerDetails
@@ -10,29 +11,120 @@ from .leaderboard import Leaderboard
 from .table_details import TableDetails
 from .bonus import Bonus
 from .penalty import Penalty
-
-
-BASE_URL = 'https://www.mk8dx-lounge.com/api'
-
-
-class LoungeAPIError(Exception):
-
-    __slots__ = (
-        'status',
-        'messages'
-    )
-
-    def __init__(self, status: int, messages: list[str]) -> None:
-        self.status: int = status
-        self.messages: list[str] = messages
+from .sanctions import PlayerSanctions
+from .client import BASE_URL, LoungeAPIError, LoungeAPIThrottledError, LoungeClient
+from .cache import ResponseCache
+from .table_store import TableStore
+from .table_sync import TableSync, TableSyncResult
+from .table_watch import TableEvent, TableWatcher
+from .rate_limit import RateLimiter, RetryPolicy
+from .sync_client import SyncLoungeClient
+from .instrumentation import RequestEvent, RequestMetrics
+from .identity import IdentityIndex
+from .name_search import NameSearchIndex, normalize_name
+from .partners import PartnerGraph, PartnerStats
+
+# the package re-exports everything listed here with `from .lounge_api import *`
+__all__ = [
+    'Player',
+    'PlayerDetails',
+    'PlayerList',
+    'Leaderboard',
+    'TableDetails',
+    'Bonus',
+    'Penalty',
+    'PlayerSanctions',
+    'BASE_URL',
+    'LoungeAPIError',
+    'LoungeAPIThrottledError',
+    'LoungeClient',
+    'ResponseCache',
+    'TableStore',
+    'TableSync',
+    'TableSyncResult',
+    'TableEvent',
+    'TableWatcher',
+    'RateLimiter',
+    'RetryPolicy',
+    'SyncLoungeClient',
+    'RequestEvent',
+    'RequestMetrics',
+    'IdentityIndex',
+    'NameSearchIndex',
+    'normalize_name',
+    'PartnerGraph',
+    'PartnerStats',
+    'default_client',
+    'close',
+    'configure',
+    'get',
+    'get_player',
+    'get_player_details',
+    'get_player_list',
+    'get_leaderboard',
+    'iter_leaderboard',
+    'get_table',
+    'get_tables',
+    'get_list',
+    'iter_list',
+    'get_table_unverified',
+    'iter_table_unverified',
+    'get_bonus',
+    'get_bonus_list',
+    'get_penalty',
+    'get_penalty_list',
+    'get_sanctions'
+]
+
+
+_default_clients: dict[asyncio.AbstractEventLoop, tuple[LoungeClient, AsyncGenerator[None, None]]] = {}
+_default_options: dict[str, Any] = {}
+
+
+async def _close_with_loop(
+    loop: asyncio.AbstractEventLoop,
+    client: LoungeClient
+) -> AsyncGenerator[None, None]:
+    # asyncio.run closes every started async generator before it closes the loop, which is the
+    # only hook it offers to release the session of callers who never call close()
+    try:
+        yield
+    finally:
+        _default_clients.pop(loop, None)
+        await client.close()
+
+
+def default_client() -> LoungeClient:
+    # a session cannot outlive its event loop, so each loop gets its own shared client
+    loop = asyncio.get_running_loop()
+    entry = _default_clients.get(loop)
+    if entry is None:
+        client = LoungeClient(**{'rate_limiter': RateLimiter(), **_default_options})
+        closer = _close_with_loop(loop, client)
+        # run it up to its yield, which registers it with the loop's shutdown_asyncgens
+        try:
+            closer.asend(None).send(None)
+        except StopIteration:
+            pass
+        entry = _default_clients[loop] = (client, closer)
+    return entry[0]
+
+
+async def close() -> None:
+    entry = _default_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+
+async def configure(**options: Any) -> None:
+    # options are passed to LoungeClient, e.g. configure(base_url='http://127.0.0.1:8080/api')
+    global _default_options
+    await close()
+    _default_options = options
 
 
 async def get(path: str, params: dict = {}) -> Optional[dict[str, Any]]:
-    async with aiohttp.ClientSession() as session:
-        async with session.get(BASE_URL + path, params=params) as response:
-            if response.status != 200:
-                return None
-            return await response.json()
+    return await default_client().get(path=path, params=params)
 
 
 async def get_player(
@@ -43,55 +135,22 @@ async def get_player(
     fc=None,
     season=None
 ) -> Optional[Player]:
-    params = {}
-    if id is not None:
-        params['id'] = id
-    elif name is not None:
-        params['name'] = name
-    elif mkc_id is not None:
-        params['mkcId'] = mkc_id
-    elif discord_id is not None:
-        params['discordId'] = discord_id
-    elif fc is not None:
-        params['fc'] = fc
-    else:
-        return None
-    if season is not None:
-        params['season'] = season
-    data = await get(path='/player', params=params)
-    if data is None:
-        return None
-    return Player.loads(data=data)
+    return await default_client().get_player(
+        id=id,
+        name=name,
+        mkc_id=mkc_id,
+        discord_id=discord_id,
+        fc=fc,
+        season=season
+    )
 
 
 async def get_player_details(id=None, name=None, season=None) -> Optional[PlayerDetails]:
-    params = {}
-    if id is not None:
-        params['id'] = id
-    elif name is not None:
-        params['name'] = name
-    else:
-        return None
-    if season is not None:
-        params['season'] = season
-    data = await get(path='/player/details', params=params)
-    if data is None:
-        return None
-    return PlayerDetails.loads(data=data)
+    return await default_client().get_player_details(id=id, name=name, season=season)
 
 
 async def get_player_list(min_mmr=None, max_mmr=None, season=None) -> Optional[PlayerList]:
-    params = {}
-    if min_mmr is not None:
-        params['minMmr'] = min_mmr
-    if max_mmr is not None:
-        params['maxMmr'] = max_mmr
-    if season is not None:
-        params['season'] = season
-    data = await get(path='/player/list', params=params)
-    if data is None:
-        return None
-    return PlayerList.loads(data=data)
+    return await default_client().get_player_list(min_mmr=min_mmr, max_mmr=max_mmr, season=season)
 
 
 async def get_leaderboard(
@@ -105,84 +164,97 @@ async def get_leaderboard(
     min_events_played=None,
     max_events_played=None
 ) -> Optional[Leaderboard]:
-    params = {'season': season, 'skip': skip, 'pageSize': page_size}
-    if search is not None:
-        params['search'] = search
-    if country is not None:
-        params['country'] = country
-    if min_mmr is not None:
-        params['minMmr'] = min_mmr
-    if max_mmr is not None:
-        params['maxMmr'] = max_mmr
-    if min_events_played is not None:
-        params['minEventsPlayed'] = min_events_played
-    if max_events_played is not None:
-        params['maxEventsPlayed'] = max_events_played
-    data = await get(path='/player/leaderboard', params=params)
-    if data is None:
-        return None
-    return Leaderboard.loads(data=data)
-
-
-async def get_table(table_id: int) -> Optional[TableDetails]:
-    params = {'tableId': table_id}
-    data = await get(path='/table', params=params)
-    if data is None:
-        return None
-    return TableDetails.loads(data=data)
+    return await default_client().get_leaderboard(
+        season=season,
+        skip=skip,
+        page_size=page_size,
+        search=search,
+        country=country,
+        min_mmr=min_mmr,
+        max_mmr=max_mmr,
+        min_events_played=min_events_played,
+        max_events_played=max_events_played
+    )
+
+
+async def iter_leaderboard(
+    season: int,
+    page_size: int = 100,
+    search=None,
+    country=None,
+    min_mmr=None,
+    max_mmr=None,
+    min_events_played=None,
+    max_events_played=None,
+    prefetch: int = 4
+) -> AsyncIterator[Leaderboard.Player]:
+    players = default_client().iter_leaderboard(
+        season=season,
+        page_size=page_size,
+        search=search,
+        country=country,
+        min_mmr=min_mmr,
+        max_mmr=max_mmr,
+        min_events_played=min_events_played,
+        max_events_played=max_events_played,
+        prefetch=prefetch
+    )
+    async with aclosing(players):
+        async for player in players:
+            yield player
+
+
+async def get_table(table_id: int, refresh: bool = False) -> Optional[TableDetails]:
+    return await default_client().get_table(table_id=table_id, refresh=refresh)
+
+
+async def get_tables(
+    table_ids: Iterable[int],
+    concurrency: int = 8,
+    refresh: bool = False
+) -> list[Union[TableDetails, None, BaseException]]:
+    return await default_client().get_tables(
+        table_ids=table_ids,
+        concurrency=concurrency,
+        refresh=refresh
+    )
 
 
 async def get_list(after=None, before=None, season=None) -> Optional[list[TableDetails]]:
-    params = {}
-    if after is not None:
-        params['from'] = after
-    if before is not None:
-        params['to'] = before
-    if season is not None:
-        params['season'] = season
-    data = await get(path='/table/list', params=params)
-    if data is None:
-        return None
-    return TableDetails.loads_list(data=data)
+    return await default_client().get_list(after=after, before=before, season=season)
+
+
+async def iter_list(after=None, before=None, season=None) -> AsyncIterator[TableDetails]:
+    tables = default_client().iter_list(after=after, before=before, season=season)
+    async with aclosing(tables):
+        async for table in tables:
+            yield table
 
 
 async def get_table_unverified(season=None) -> Optional[list[TableDetails]]:
-    params = {}
-    if season is not None:
-        params['season'] = season
-    data = await get(path='/table/unverified', params=params)
-    if data is None:
-        return None
-    return TableDetails.loads_list(data=data)
+    return await default_client().get_table_unverified(season=season)
+
+
+async def iter_table_unverified(season=None) -> AsyncIterator[TableDetails]:
+    tables = default_client().iter_table_unverified(season=season)
+    async with aclosing(tables):
+        async for table in tables:
+            yield table
 
 
 async def get_bonus(id: int) -> Optional[Bonus]:
-    params = {'id': id}
-    data = await get(path='/bonus', params=params)
-    if data is None:
-        return None
-    return Bonus.loads(data=data)
+    return await default_client().get_bonus(id=id)
 
 
 async def get_bonus_list(
     name: str,
     season=None
 ) -> Optional[list[Bonus]]:
-    params = {'name': name},
-    if season is not None:
-        params['season'] = season
-    data = await get(path='/bonus/list', params=params)
-    if data is None:
-        return None
-    return Bonus.loads_list(data=data)
+    return await default_client().get_bonus_list(name=name, season=season)
 
 
 async def get_penalty(id: int) -> Optional[Penalty]:
-    params = {'id': id}
-    data = await get(path='/penalty', params=params)
-    if data is None:
-        return None
-    return Penalty.loads(data=data)
+    return await default_client().get_penalty(id=id)
 
 
 async def get_penalty_list(
@@ -192,14 +264,24 @@ async def get_penalty_list(
     include_deleted=False,
     season=None
 ) -> Optional[list[Penalty]]:
-    params = {'name': name, 'includeDeleted': str(include_deleted)}
-    if is_strike is not None:
-        params['isStrike'] = is_strike
-    if after is not None:
-        params['from'] = after
-    if season is not None:
-        params['season'] = season
-    data = await get(path='/penalty/list', params=params)
-    if data is None:
-        return None
-    return Penalty.loads_list(data=data)
+    return await default_client().get_penalty_list(
+        name=name,
+        is_strike=is_strike,
+        after=after,
+        include_deleted=include_deleted,
+        season=season
+    )
+
+
+async def get_sanctions(
+    names: Iterable[str],
+    season=None,
+    include_deleted=False,
+    concurrency: int = 8
+) -> dict[str, Union[PlayerSanctions, None, BaseException]]:
+    return await default_client().get_sanctions(
+        names=names,
+        season=season,
+        include_deleted=include_deleted,
+        concurrency=concurrency
+    )
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Hashable, Iterable, Mapping, Optional, Sequence, TypeVar, Union
+import numpy as np
+
+from .player_list import PlayerList
+from .leaderboard import Leaderboard
+from .rank import Rank
+
+T = TypeVar('T')
+
+
+class MmrDistribution:
+
+    # players without an MMR (placement) are not part of the distribution
+    __slots__ = (
+        'mmrs',
+        '_sorted'
+    )
+
+    def __init__(self, mmrs: Optional[Mapping[Hashable, int]] = None) -> None:
+        self.mmrs: dict[Hashable, int] = {} if mmrs is None else dict(mmrs)
+        self._sorted: np.ndarray = np.sort(np.fromiter(self.mmrs.values(), np.int64, len(self.mmrs)))
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    @property
+    def sorted(self) -> np.ndarray:
+        return self._sorted
+
+    @staticmethod
+    def from_players(players: Iterable[Union[PlayerList.Player, Leaderboard.Player]]) -> MmrDistribution:
+        return MmrDistribution({player.name: player.mmr for player in players if player.mmr is not None})
+
+    @staticmethod
+    def from_player_list(player_list: PlayerList) -> MmrDistribution:
+        return MmrDistribution.from_players(player_list.players)
+
+    def update(self, key: Hashable, mmr: Optional[int]) -> None:
+        # a single change shifts the tail of the sorted array instead of re-sorting it
+        old = self.mmrs.pop(key, None)
+        if old is not None:
+            self._sorted = np.delete(self._sorted, np.searchsorted(self._sorted, old))
+        if mmr is not None:
+            self.mmrs[key] = mmr
+            self._sorted = np.insert(self._sorted, np.searchsorted(self._sorted, mmr), mmr)
+
+    def update_many(self, mmrs: Mapping[Hashable, Optional[int]]) -> None:
+        if len(mmrs) < 16:
+            for key, mmr in mmrs.items():
+                self.update(key, mmr)
+            return
+        for key, mmr in mmrs.items():
+            if mmr is None:
+                self.mmrs.pop(key, None)
+            else:
+                self.mmrs[key] = mmr
+        self._sorted = np.sort(np.fromiter(self.mmrs.values(), np.int64, len(self.mmrs)))
+
+    def count_above(self, mmr: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+        return len(self._sorted) - np.searchsorted(self._sorted, mmr, side='right')
+
+    def rank(self, mmr: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+        # 1-based position on the leaderboard; ties share the best rank
+        return self.count_above(mmr) + 1
+
+    def top_percent(self, mmr: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+        if not len(self._sorted):
+            return np.full(np.shape(mmr), np.nan) if np.ndim(mmr) else float('nan')
+        return 100 * self.rank(mmr) / len(self._sorted)
+
+    def percentile(self, mmr: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+        # share of players at or below mmr
+        if not len(self._sorted):
+            return np.full(np.shape(mmr), np.nan) if np.ndim(mmr) else float('nan')
+        return 100 * np.searchsorted(self._sorted, mmr, side='right') / len(self._sorted)
+
+    def mmr_at_percentile(self, q: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        return np.percentile(self._sorted, q)
+
+    def histogram(
+        self,
+        bins: Union[int, Sequence[int], np.ndarray] = 20,
+        range: Optional[tuple[int, int]] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # (counts, bin_edges) as returned by numpy.histogram
+        return np.histogram(self._sorted, bins=bins, range=range)
+
+    def division_counts(self, thresholds: Iterable[tuple[T, int]]) -> dict[T, int]:
+        # thresholds are (division, minimum MMR) pairs; MMRs below the lowest minimum are not counted
+        thresholds = sorted(thresholds, key=lambda threshold: threshold[1])
+        starts = np.searchsorted(self._sorted, [threshold[1] for threshold in thresholds], side='left')
+        counts = np.diff(np.append(starts, len(self._sorted)))
+        return {threshold[0]: int(count) for threshold, count in zip(thresholds, counts)}
+
+    def rank_counts(self, season: int) -> dict[Rank, int]:
+        return self.division_counts(Rank.thresholds(season))
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence
+from datetime import datetime, timedelta, timezone
+import numpy as np
+
+from .player_details import PlayerDetails
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_datetime64(time: datetime) -> np.datetime64:
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=timezone.utc)
+    return np.datetime64((time - _EPOCH) // _MICROSECOND, 'us')
+
+
+class MmrHistory:
+
+    # optional integer columns (score, rank, num_teams) are float64 with NaN where missing
+    __slots__ = (
+        'time',
+        'new_mmr',
+        'delta',
+        'score',
+        'rank',
+        'num_teams',
+        'reason',
+        'tier',
+        'tiers'
+    )
+
+    REASONS: tuple[PlayerDetails.MmrChange.Reason, ...] = tuple(PlayerDetails.MmrChange.Reason)
+
+    def __init__(
+        self,
+        time: np.ndarray,
+        new_mmr: np.ndarray,
+        delta: np.ndarray,
+        score: np.ndarray,
+        rank: np.ndarray,
+        num_teams: np.ndarray,
+        reason: np.ndarray,
+        tier: np.ndarray,
+        tiers: tuple[str, ...]
+    ) -> None:
+        self.time: np.ndarray = time
+        self.new_mmr: np.ndarray = new_mmr
+        self.delta: np.ndarray = delta
+        self.score: np.ndarray = score
+        self.rank: np.ndarray = rank
+        self.num_teams: np.ndarray = num_teams
+        self.reason: np.ndarray = reason
+        self.tier: np.ndarray = tier
+        self.tiers: tuple[str, ...] = tiers
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    @staticmethod
+    def from_mmr_changes(mmr_changes: Sequence[PlayerDetails.MmrChange]) -> MmrHistory:
+        reason_codes = {reason: code for code, reason in enumerate(MmrHistory.REASONS)}
+        tier_codes: dict[str, int] = {}
+        nan = float('nan')
+        # the API lists changes newest first; columns are kept in chronological order
+        times = np.array([_to_datetime64(c.time) for c in mmr_changes], dtype='datetime64[us]')
+        order = np.argsort(times, kind='stable')
+        changes = [mmr_changes[i] for i in order]
+        tiers = [
+            -1 if c.tier is None else tier_codes.setdefault(c.tier, len(tier_codes))
+            for c in changes
+        ]
+        return MmrHistory(
+            time=times[order],
+            new_mmr=np.array([c.new_mmr for c in changes], dtype=np.int64),
+            delta=np.array([c.mmr_delta for c in changes], dtype=np.int64),
+            score=np.array([nan if c.score is None else c.score for c in changes], dtype=np.float64),
+            rank=np.array([nan if c.rank is None else c.rank for c in changes], dtype=np.float64),
+            num_teams=np.array(
+                [nan if c.num_teams is None else c.num_teams for c in changes],
+                dtype=np.float64
+            ),
+            reason=np.array([reason_codes[c.reason] for c in changes], dtype=np.int8),
+            tier=np.array(tiers, dtype=np.int16),
+            tiers=tuple(tier_codes)
+        )
+
+    def reason_mask(self, *reasons: PlayerDetails.MmrChange.Reason) -> np.ndarray:
+        return np.isin(self.reason, [MmrHistory.REASONS.index(reason) for reason in reasons])
+
+    def peak_mmr(self) -> Optional[int]:
+        if len(self) == 0:
+            return None
+        return int(self.new_mmr.max())
+
+    def max_score(self) -> Optional[int]:
+        scores = self.score[~np.isnan(self.score)]
+        if len(scores) == 0:
+            return None
+        return int(scores.max())
+
+    def average_score(self) -> Optional[float]:
+        scores = self.score[~np.isnan(self.score)]
+        if len(scores) == 0:
+            return None
+        return float(scores.mean())
+
+    def average_score_per_tier(self) -> dict[str, float]:
+        played = ~np.isnan(self.score) & (self.tier >= 0)
+        tiers = self.tier[played]
+        counts = np.bincount(tiers, minlength=len(self.tiers))
+        sums = np.bincount(tiers, weights=self.score[played], minlength=len(self.tiers))
+        return {
+            tier: float(sums[code] / counts[code])
+            for code, tier in enumerate(self.tiers)
+            if counts[code] > 0
+        }
+
+    def rolling_average_score(self, window: int = 10) -> np.ndarray:
+        scores = self.score[~np.isnan(self.score)]
+        if len(scores) < window:
+            return np.empty(0, dtype=np.float64)
+        sums = np.cumsum(np.concatenate(([0.0], scores)))
+        return (sums[window:] - sums[:-window]) / window
+
+    def score_distribution(
+        self,
+        bins: int = 18,
+        score_range: tuple[int, int] = (0, 180)
+    ) -> tuple[np.ndarray, np.ndarray]:
+        return np.histogram(self.score[~np.isnan(self.score)], bins=bins, range=score_range)
+
+    def mmr_at(self, time: datetime) -> Optional[int]:
+        index = int(np.searchsorted(self.time, _to_datetime64(time), side='right')) - 1
+        if index < 0:
+            return None
+        return int(self.new_mmr[index])
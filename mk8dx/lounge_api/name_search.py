@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from typing import Any, Hashable, Iterable, Optional
+from collections import Counter
+import heapq
+import unicodedata
+
+from .player import Player
+from .player_details import PlayerDetails
+from .player_list import PlayerList
+from .leaderboard import Leaderboard
+
+
+def normalize_name(name: str) -> str:
+    # full-width letters and case differences are common typos in Lounge names
+    return ''.join(unicodedata.normalize('NFKC', name).casefold().split())
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f'  {key} '
+    return {padded[i:i+3] for i in range(len(padded) - 2)}
+
+
+class NameSearchIndex:
+
+    __slots__ = (
+        '_keys',
+        '_spellings',
+        '_owners',
+        '_trigrams',
+        '_ids',
+        '_postings',
+        '_free',
+        '_names',
+        '_entries',
+        '_aliases'
+    )
+
+    def __init__(self) -> None:
+        # every entry is a searchable spelling (a current or former name) of one player, who is
+        # ('id', player_id), or ('mkc', mkc_id) until the player id is known
+        self._keys: list[Optional[str]] = []
+        self._spellings: list[Optional[str]] = []
+        self._owners: list[Optional[Hashable]] = []
+        self._trigrams: list[set[str]] = []
+        self._ids: dict[str, int] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._free: list[int] = []
+        self._names: dict[Hashable, str] = {}
+        self._entries: dict[Hashable, set[int]] = {}
+        self._aliases: dict[Hashable, Hashable] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self._ids
+
+    class Match:
+
+        __slots__ = (
+            'name',
+            'matched',
+            'score'
+        )
+
+        def __init__(self, name: str, matched: str, score: float) -> None:
+            self.name: str = name
+            self.matched: str = matched
+            self.score: float = score
+
+        def __repr__(self) -> str:
+            return f'Match(name={self.name!r}, matched={self.matched!r}, score={self.score:.3f})'
+
+    def _owner(self, name: str, player_id: Optional[int], mkc_id: Optional[int]) -> Hashable:
+        if player_id is not None:
+            owner = ('id', player_id)
+            if mkc_id is not None:
+                alias = ('mkc', mkc_id)
+                self._aliases[alias] = owner
+                if alias in self._entries:
+                    # first seen in a player list, which carries only the MKC id
+                    for entry_id in self._entries.pop(alias):
+                        self._owners[entry_id] = owner
+                        self._entries.setdefault(owner, set()).add(entry_id)
+                    self._names.setdefault(owner, self._names.pop(alias))
+            return owner
+        if mkc_id is not None:
+            alias = ('mkc', mkc_id)
+            return self._aliases.get(alias, alias)
+        # without any id a name can only stand for itself
+        return ('name', normalize_name(name))
+
+    def add_name(
+        self,
+        name: str,
+        former_names: Iterable[str] = (),
+        player_id: Optional[int] = None,
+        mkc_id: Optional[int] = None
+    ) -> None:
+        # a rename keeps the player's old spellings, which now resolve to the new name
+        owner = self._owner(name, player_id, mkc_id)
+        self._names[owner] = name
+        self._put(name, owner, current=True)
+        for former_name in former_names:
+            self._put(former_name, owner, current=False)
+
+    def _put(self, matched: str, owner: Hashable, current: bool) -> None:
+        key = normalize_name(matched)
+        if not key:
+            return
+        entry_id = self._ids.get(key)
+        if entry_id is not None:
+            previous = self._owners[entry_id]
+            if previous == owner:
+                return
+            # a former name that is somebody's current name stays theirs
+            if not current and normalize_name(self._names[previous]) == key:
+                return
+            entries = self._entries[previous]
+            entries.discard(entry_id)
+            if not entries:
+                del self._entries[previous]
+                del self._names[previous]
+            self._owners[entry_id] = owner
+            self._spellings[entry_id] = matched
+            self._entries.setdefault(owner, set()).add(entry_id)
+            return
+        trigrams = _trigrams(key)
+        if self._free:
+            entry_id = self._free.pop()
+            self._keys[entry_id] = key
+            self._spellings[entry_id] = matched
+            self._owners[entry_id] = owner
+            self._trigrams[entry_id] = trigrams
+        else:
+            entry_id = len(self._keys)
+            self._keys.append(key)
+            self._spellings.append(matched)
+            self._owners.append(owner)
+            self._trigrams.append(trigrams)
+        self._ids[key] = entry_id
+        self._entries.setdefault(owner, set()).add(entry_id)
+        for trigram in trigrams:
+            posting = self._postings.get(trigram)
+            if posting is None:
+                self._postings[trigram] = {entry_id}
+            else:
+                posting.add(entry_id)
+
+    def remove(self, name: str) -> None:
+        # removes the player the name belongs to, with all of their spellings
+        entry_id = self._ids.get(normalize_name(name))
+        if entry_id is None:
+            return
+        owner = self._owners[entry_id]
+        del self._names[owner]
+        for entry_id in self._entries.pop(owner):
+            del self._ids[self._keys[entry_id]]
+            for trigram in self._trigrams[entry_id]:
+                self._postings[trigram].discard(entry_id)
+            self._keys[entry_id] = None
+            self._spellings[entry_id] = None
+            self._owners[entry_id] = None
+            self._trigrams[entry_id] = set()
+            self._free.append(entry_id)
+
+    def add(self, value: Any) -> None:
+        if isinstance(value, Player):
+            self.add_name(value.name, player_id=value.id, mkc_id=value.mkc_id)
+        elif isinstance(value, PlayerList.Player):
+            self.add_name(value.name, mkc_id=value.mkc_id)
+        elif isinstance(value, Leaderboard.Player):
+            self.add_name(value.name, player_id=value.id)
+        elif isinstance(value, PlayerDetails):
+            self.add_name(
+                value.name,
+                value.former_names,
+                player_id=value.player_id,
+                mkc_id=value.mkc_id
+            )
+        elif isinstance(value, PlayerList):
+            self.add_all(value.players)
+        elif isinstance(value, Leaderboard):
+            self.add_all(value.data)
+        elif isinstance(value, list):
+            self.add_all(value)
+
+    def add_all(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.add(value)
+
+    def search(self, query: str, k: int = 5, min_score: float = 0.3) -> list[NameSearchIndex.Match]:
+        key = normalize_name(query)
+        if not key:
+            return []
+        trigrams = _trigrams(key)
+        counts: Counter[int] = Counter()
+        for trigram in trigrams:
+            posting = self._postings.get(trigram)
+            if posting:
+                counts.update(posting)
+        if not counts:
+            return []
+        # shared trigram counts are a cheap prefilter; only the best candidates get the exact
+        # Dice coefficient, which also accounts for the length of the candidate name
+        candidates = heapq.nlargest(max(k * 8, 32), counts.items(), key=lambda item: item[1])
+        size = len(trigrams)
+        scored = []
+        for entry_id, shared in candidates:
+            score = 2 * shared / (size + len(self._trigrams[entry_id]))
+            if score >= min_score:
+                scored.append((score, entry_id))
+        matches: list[NameSearchIndex.Match] = []
+        seen: set[Hashable] = set()
+        for score, entry_id in sorted(scored, key=lambda item: (-item[0], self._keys[item[1]])):
+            owner = self._owners[entry_id]
+            if owner in seen:
+                continue
+            seen.add(owner)
+            matches.append(NameSearchIndex.Match(
+                name=self._names[owner],
+                matched=self._spellings[entry_id],
+                score=score
+            ))
+            if len(matches) == k:
+                break
+        return matches
+
+    def best(self, query: str, min_score: float = 0.3) -> Optional[str]:
+        matches = self.search(query, k=1, min_score=min_score)
+        if not matches:
+            return None
+        return matches[0].name
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any
+from concurrent.futures import Executor
+import asyncio
+import json
+
+
+def decode_list(raw: bytes, model: type) -> bytes:
+    # runs in a worker process; model is a class such as TableDetails, and its compact binary
+    # form is much smaller to send back than a pickle of the model objects. That form is built
+    # from materialized models, so there is no lazy decoding here
+    return model.to_bytes_list(model.loads_list(json.loads(raw)))
+
+
+async def load_list(
+    executor: Executor,
+    raw: bytes,
+    model: type,
+    chunk_size: int = 64
+) -> list[Any]:
+    loop = asyncio.get_running_loop()
+    data = await loop.run_in_executor(executor, decode_list, raw, model)
+    # rebuilding the objects still happens on the event loop, so it yields between chunks
+    values = []
+    for value in model.iter_bytes_list(data):
+        values.append(value)
+        if len(values) % chunk_size == 0:
+            await asyncio.sleep(0)
+    return values
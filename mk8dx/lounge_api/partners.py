@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional
+
+from .player_details import PlayerDetails
+from .table_details import TableDetails
+
+
+class PartnerStats:
+
+    __slots__ = (
+        'partner_id',
+        'count',
+        'score_sum',
+        'partner_score_sum'
+    )
+
+    def __init__(self, partner_id: int) -> None:
+        self.partner_id: int = partner_id
+        self.count: int = 0
+        self.score_sum: int = 0
+        self.partner_score_sum: int = 0
+
+    @property
+    def average_score(self) -> float:
+        return self.score_sum / self.count
+
+    @property
+    def average_partner_score(self) -> float:
+        return self.partner_score_sum / self.count
+
+    @property
+    def average_team_score(self) -> float:
+        return (self.score_sum + self.partner_score_sum) / self.count
+
+
+class PartnerGraph:
+
+    # every table contributes each of its teams once, whether it was seen through a table or
+    # through the MMR history of any of the team's members
+    __slots__ = (
+        '_edges',
+        '_teams',
+        '_deleted',
+        '_ranked'
+    )
+
+    def __init__(self) -> None:
+        self._edges: dict[int, dict[int, PartnerStats]] = {}
+        self._teams: dict[int, dict[int, tuple[tuple[int, int], ...]]] = {}
+        self._deleted: set[int] = set()
+        self._ranked: dict[int, list[PartnerStats]] = {}
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._edges
+
+    @property
+    def table_count(self) -> int:
+        return len(self._teams)
+
+    def _update(self, team: tuple[tuple[int, int], ...], sign: int) -> None:
+        for player_id, score in team:
+            edges = self._edges.setdefault(player_id, {})
+            for partner_id, partner_score in team:
+                if partner_id == player_id:
+                    continue
+                stats = edges.get(partner_id)
+                if stats is None:
+                    stats = edges[partner_id] = PartnerStats(partner_id)
+                stats.count += sign
+                stats.score_sum += sign * score
+                stats.partner_score_sum += sign * partner_score
+                if not stats.count:
+                    del edges[partner_id]
+            self._ranked.pop(player_id, None)
+
+    def add_team(self, table_id: int, team: Iterable[tuple[int, int]]) -> bool:
+        # team is (player_id, score) for every member; returns whether it was new
+        if table_id in self._deleted:
+            return False
+        team = tuple(team)
+        teams = self._teams.setdefault(table_id, {})
+        if any(player_id in teams for player_id, _ in team):
+            return False
+        for player_id, _ in team:
+            teams[player_id] = team
+        self._update(team, 1)
+        return True
+
+    def remove_table(self, table_id: int) -> None:
+        self._deleted.add(table_id)
+        teams = self._teams.pop(table_id, None)
+        if teams is None:
+            return
+        for team in {id(team): team for team in teams.values()}.values():
+            self._update(team, -1)
+
+    def add_table(self, table: TableDetails) -> None:
+        if table.deleted_on is not None:
+            self.remove_table(table.id)
+            return
+        for team in table.teams:
+            self.add_team(table.id, ((score.player_id, score.score) for score in team.scores))
+
+    def add_mmr_change(self, player_id: int, mmr_change: PlayerDetails.MmrChange) -> None:
+        if mmr_change.change_id is None:
+            return
+        if mmr_change.reason is PlayerDetails.MmrChange.Reason.TABLE_DELETE:
+            self.remove_table(mmr_change.change_id)
+            return
+        if (
+            mmr_change.reason is not PlayerDetails.MmrChange.Reason.TABLE
+            or mmr_change.score is None
+            or mmr_change.partner_ids is None
+            or mmr_change.partner_scores is None
+        ):
+            return
+        self.add_team(mmr_change.change_id, (
+            (player_id, mmr_change.score),
+            *zip(mmr_change.partner_ids, mmr_change.partner_scores)
+        ))
+
+    def add_player_details(self, player_details: PlayerDetails) -> None:
+        for mmr_change in player_details.mmr_changes:
+            self.add_mmr_change(player_details.player_id, mmr_change)
+
+    def add(self, value: Any) -> None:
+        if isinstance(value, TableDetails):
+            self.add_table(value)
+        elif isinstance(value, PlayerDetails):
+            self.add_player_details(value)
+        elif isinstance(value, list):
+            self.add_all(value)
+
+    def add_all(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.add(value)
+
+    def partners(self, player_id: int) -> list[PartnerStats]:
+        # most frequent partner first; cached until the player's edges change
+        ranked = self._ranked.get(player_id)
+        if ranked is None:
+            ranked = sorted(
+                self._edges.get(player_id, {}).values(),
+                key=lambda stats: (-stats.count, -stats.score_sum, stats.partner_id)
+            )
+            self._ranked[player_id] = ranked
+        return ranked
+
+    def top_partners(self, player_id: int, k: int = 5) -> list[PartnerStats]:
+        return self.partners(player_id)[:k]
+
+    def pair(self, player_id: int, partner_id: int) -> Optional[PartnerStats]:
+        return self._edges.get(player_id, {}).get(partner_id)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
+from . import binary
 
 
 class Player:
@@ -52,3 +53,48 @@ class Player:
             mmr=data.get('mmr'),
             max_mmr=data.get('maxMmr')
         )
+
+    def dumps(self) -> dict[str, Any]:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'mkcId': self.mkc_id,
+            'discordId': self.discord_id,
+            'countryCode': self.country_code,
+            'switchFc': self.switch_fc,
+            'isHidden': self.is_hidden,
+            'mmr': self.mmr,
+            'maxMmr': self.max_mmr
+        }
+
+    def write_binary(self, writer: binary.BinaryWriter) -> None:
+        writer.uint(self.id)
+        writer.str(self.name)
+        writer.int(self.mkc_id)
+        writer.optional_str(self.discord_id)
+        writer.optional_str(self.country_code)
+        writer.optional_str(self.switch_fc)
+        writer.bool(self.is_hidden)
+        writer.optional_int(self.mmr)
+        writer.optional_int(self.max_mmr)
+
+    @staticmethod
+    def read_binary(reader: binary.BinaryReader) -> Player:
+        return Player(
+            id=reader.uint(),
+            name=reader.str(),
+            mkc_id=reader.int(),
+            discord_id=reader.optional_str(),
+            country_code=reader.optional_str(),
+            switch_fc=reader.optional_str(),
+            is_hidden=reader.bool(),
+            mmr=reader.optional_int(),
+            max_mmr=reader.optional_int()
+        )
+
+    def to_bytes(self) -> bytes:
+        return binary.to_bytes(self, binary.PLAYER)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> Player:
+        return binary.from_bytes(data, binary.PLAYER, Player.read_binary)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 from enum import Enum
 from datetime import datetime
-from dateutil.parser import isoparse
+from .timestamp import parse_datetime
 from .rank import Rank
+from .decode import DecodeContext
+from . import binary
+
+if TYPE_CHECKING:
+    from .mmr_history import MmrHistory
 
 
 class PlayerDetails:
@@ -33,8 +38,12 @@ class PlayerDetails:
         'average_score',
         'average_last_ten',
         'partner_average',
-        'mmr_changes',
-        'name_history',
+        '_mmr_changes',
+        '_mmr_changes_data',
+        '_context',
+        '_name_history',
+        '_name_history_data',
+        '_mmr_history',
         'rank'
     )
 
@@ -90,22 +99,78 @@ class PlayerDetails:
         self.average_score: Optional[float] = average_score
         self.average_last_ten: Optional[float] = average_last_ten
         self.partner_average: Optional[float] = partner_average
-        self.mmr_changes: list[PlayerDetails.MmrChange] = mmr_changes
-        self.name_history: list[PlayerDetails.NameChange] = name_history
+        self.mmr_changes = mmr_changes
+        self.name_history = name_history
         self.rank: Rank = rank
 
+    @property
+    def mmr_changes(self) -> list[PlayerDetails.MmrChange]:
+        if self._mmr_changes is None:
+            self._mmr_changes = PlayerDetails.MmrChange.loads_list(
+                data=self._mmr_changes_data,
+                context=self._context
+            )
+            self._mmr_changes_data = None
+            self._context = None
+        return self._mmr_changes
+
+    @mmr_changes.setter
+    def mmr_changes(self, mmr_changes: list[PlayerDetails.MmrChange]) -> None:
+        self._mmr_changes: Optional[list[PlayerDetails.MmrChange]] = mmr_changes
+        self._mmr_changes_data: Optional[list[dict[str, Any]]] = None
+        # the context of loads, kept until the MMR changes are materialized so they share its strings
+        self._context: Optional[DecodeContext] = None
+        self._mmr_history: Optional[MmrHistory] = None
+
+    @property
+    def mmr_history(self) -> MmrHistory:
+        # requires numpy, so it is imported only when a columnar view is asked for
+        if self._mmr_history is None:
+            from .mmr_history import MmrHistory
+            self._mmr_history = MmrHistory.from_mmr_changes(self.mmr_changes)
+        return self._mmr_history
+
+    @property
+    def name_history(self) -> list[PlayerDetails.NameChange]:
+        if self._name_history is None:
+            self._name_history = PlayerDetails.NameChange.loads_list(data=self._name_history_data)
+            self._name_history_data = None
+        return self._name_history
+
+    @name_history.setter
+    def name_history(self, name_history: list[PlayerDetails.NameChange]) -> None:
+        self._name_history: Optional[list[PlayerDetails.NameChange]] = name_history
+        self._name_history_data: Optional[list[dict[str, Any]]] = None
+
+    @property
+    def former_names(self) -> list[str]:
+        # read from the raw data while the name history is unmaterialized, so lazy details stay lazy
+        if self._name_history is None:
+            return [name_change['name'] for name_change in self._name_history_data]
+        return [name_change.name for name_change in self._name_history]
+
     @property
     def win_loss_last_ten(self) -> str:
         return f'{self.wins_last_ten} - {self.losses_last_ten}'
 
     @staticmethod
-    def loads(data: dict[str, Any]) -> PlayerDetails:
-        return PlayerDetails(
+    def loads(
+        data: dict[str, Any],
+        lazy: bool = False,
+        context: Optional[DecodeContext] = None
+    ) -> PlayerDetails:
+        if context is None:
+            context = DecodeContext()
+        mmr_changes = [] if lazy else PlayerDetails.MmrChange.loads_list(
+            data=data['mmrChanges'],
+            context=context
+        )
+        details = PlayerDetails(
             player_id=data['playerId'],
             name=data['name'],
             mkc_id=data['mkcId'],
-            country_code=data.get('countryCode'),
-            country_name=data.get('countryName'),
+            country_code=context.str(data.get('countryCode')),
+            country_name=context.str(data.get('countryName')),
             switch_fc=data.get('switchFc'),
             is_hidden=data['isHidden'],
             season=data['season'],
@@ -124,10 +189,130 @@ class PlayerDetails:
             average_score=data.get('averageScore'),
             average_last_ten=data.get('averageLastTen'),
             partner_average=data.get('partnerAverage'),
-            mmr_changes=PlayerDetails.MmrChange.loads_list(data=data['mmrChanges']),
-            name_history=PlayerDetails.NameChange.loads_list(data=data['nameHistory']),
+            mmr_changes=mmr_changes,
+            name_history=[] if lazy else PlayerDetails.NameChange.loads_list(data=data['nameHistory']),
             rank=Rank.from_name(data['rank'])
         )
+        if lazy:
+            # converted to model objects on first access
+            details._mmr_changes, details._mmr_changes_data = None, data['mmrChanges']
+            details._context = context
+            details._name_history, details._name_history_data = None, data['nameHistory']
+        return details
+
+    def dumps(self) -> dict[str, Any]:
+        return {
+            'playerId': self.player_id,
+            'name': self.name,
+            'mkcId': self.mkc_id,
+            'countryCode': self.country_code,
+            'countryName': self.country_name,
+            'switchFc': self.switch_fc,
+            'isHidden': self.is_hidden,
+            'season': self.season,
+            'mmr': self.mmr,
+            'maxMmr': self.max_mmr,
+            'overallRank': self.overall_rank,
+            'eventsPlayed': self.events_played,
+            'winRate': self.win_rate,
+            'winsLastTen': self.wins_last_ten,
+            'lossesLastTen': self.losses_last_ten,
+            'gainLossLastTen': self.gain_loss_last_ten,
+            'largestGain': self.largest_gain,
+            'largestGainTableId': self.largest_gain_table_id,
+            'largestLoss': self.largest_loss,
+            'largestLossTableId': self.largest_loss_table_id,
+            'averageScore': self.average_score,
+            'averageLastTen': self.average_last_ten,
+            'partnerAverage': self.partner_average,
+            'mmrChanges': [mmr_change.dumps() for mmr_change in self.mmr_changes],
+            'nameHistory': [name_change.dumps() for name_change in self.name_history],
+            'rank': None if self.rank is None else self.rank.name
+        }
+
+    def write_binary(self, writer: binary.BinaryWriter) -> None:
+        writer.uint(self.player_id)
+        writer.str(self.name)
+        writer.int(self.mkc_id)
+        writer.optional_str(self.country_code)
+        writer.optional_str(self.country_name)
+        writer.optional_str(self.switch_fc)
+        writer.bool(self.is_hidden)
+        writer.uint(self.season)
+        writer.optional_int(self.mmr)
+        writer.optional_int(self.max_mmr)
+        writer.optional_int(self.overall_rank)
+        writer.uint(self.events_played)
+        writer.optional_float(self.win_rate)
+        writer.uint(self.wins_last_ten)
+        writer.uint(self.losses_last_ten)
+        writer.optional_int(self.gain_loss_last_ten)
+        writer.optional_int(self.largest_gain)
+        writer.optional_int(self.largest_gain_table_id)
+        writer.optional_int(self.largest_loss)
+        writer.optional_int(self.largest_loss_table_id)
+        writer.optional_float(self.average_score)
+        writer.optional_float(self.average_last_ten)
+        writer.optional_float(self.partner_average)
+        writer.uint(len(self.mmr_changes))
+        for mmr_change in self.mmr_changes:
+            mmr_change.write_binary(writer)
+        writer.uint(len(self.name_history))
+        for name_change in self.name_history:
+            name_change.write_binary(writer)
+        writer.bool(self.rank is not None)
+        if self.rank is not None:
+            self.rank.write_binary(writer)
+
+    @staticmethod
+    def read_binary(reader: binary.BinaryReader) -> PlayerDetails:
+        return PlayerDetails(
+            player_id=reader.uint(),
+            name=reader.str(),
+            mkc_id=reader.int(),
+            country_code=reader.optional_str(),
+            country_name=reader.optional_str(),
+            switch_fc=reader.optional_str(),
+            is_hidden=reader.bool(),
+            season=reader.uint(),
+            mmr=reader.optional_int(),
+            max_mmr=reader.optional_int(),
+            overall_rank=reader.optional_int(),
+            events_played=reader.uint(),
+            win_rate=reader.optional_float(),
+            wins_last_ten=reader.uint(),
+            losses_last_ten=reader.uint(),
+            gain_loss_last_ten=reader.optional_int(),
+            largest_gain=reader.optional_int(),
+            largest_gain_table_id=reader.optional_int(),
+            largest_loss=reader.optional_int(),
+            largest_loss_table_id=reader.optional_int(),
+            average_score=reader.optional_float(),
+            average_last_ten=reader.optional_float(),
+            partner_average=reader.optional_float(),
+            mmr_changes=[PlayerDetails.MmrChange.read_binary(reader) for _ in range(reader.uint())],
+            name_history=[PlayerDetails.NameChange.read_binary(reader) for _ in range(reader.uint())],
+            rank=Rank.read_binary(reader) if reader.bool() else None
+        )
+
+    def to_bytes(self) -> bytes:
+        return binary.to_bytes(self, binary.PLAYER_DETAILS)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> PlayerDetails:
+        return binary.from_bytes(data, binary.PLAYER_DETAILS, PlayerDetails.read_binary)
+
+    @staticmethod
+    def to_bytes_list(values: list[PlayerDetails]) -> bytes:
+        return binary.to_bytes_list(values, binary.PLAYER_DETAILS)
+
+    @staticmethod
+    def from_bytes_list(data: bytes) -> list[PlayerDetails]:
+        return binary.from_bytes_list(data, binary.PLAYER_DETAILS, PlayerDetails.read_binary)
+
+    @staticmethod
+    def iter_bytes_list(data: bytes) -> Iterator[PlayerDetails]:
+        return binary.iter_bytes_list(data, binary.PLAYER_DETAILS, PlayerDetails.read_binary)
 
     class MmrChange:
 
@@ -172,24 +357,89 @@ class PlayerDetails:
             self.num_teams: Optional[int] = num_teams
 
         @staticmethod
-        def loads(data: dict[str, Any]) -> PlayerDetails.MmrChange:
+        def loads(
+            data: dict[str, Any],
+            context: Optional[DecodeContext] = None
+        ) -> PlayerDetails.MmrChange:
+            if context is None:
+                context = DecodeContext()
             return PlayerDetails.MmrChange(
                 change_id=data.get('changeId'),
                 new_mmr=data['newMmr'],
                 mmr_delta=data['mmrDelta'],
                 reason=PlayerDetails.MmrChange.Reason(data['reason']),
-                time=isoparse(data['time']),
+                time=parse_datetime(data['time']),
                 score=data.get('score'),
                 partner_scores=data.get('partnerScores'),
                 partner_ids=data.get('partnerIds'),
                 rank=data.get('rank'),
-                tier=data.get('tier'),
+                tier=context.str(data.get('tier')),
                 num_teams=data.get('numTeams')
             )
 
         @classmethod
-        def loads_list(cls, data: list[dict[str, Any]]) -> list[PlayerDetails.MmrChange]:
-            return list(map(lambda m: cls.loads(data=m), data))
+        def loads_list(
+            cls,
+            data: list[dict[str, Any]],
+            context: Optional[DecodeContext] = None
+        ) -> list[PlayerDetails.MmrChange]:
+            if context is None:
+                context = DecodeContext()
+            return list(map(lambda m: cls.loads(data=m, context=context), data))
+
+        def dumps(self) -> dict[str, Any]:
+            return {
+                'changeId': self.change_id,
+                'newMmr': self.new_mmr,
+                'mmrDelta': self.mmr_delta,
+                'reason': self.reason.value,
+                'time': binary.dump_datetime(self.time),
+                'score': self.score,
+                'partnerScores': self.partner_scores,
+                'partnerIds': self.partner_ids,
+                'rank': self.rank,
+                'tier': self.tier,
+                'numTeams': self.num_teams
+            }
+
+        def write_binary(self, writer: binary.BinaryWriter) -> None:
+            writer.optional_int(self.change_id)
+            writer.int(self.new_mmr)
+            writer.int(self.mmr_delta)
+            writer.enum(self.reason)
+            writer.datetime(self.time)
+            writer.optional_int(self.score)
+            for values in (self.partner_scores, self.partner_ids):
+                # 0 is None, otherwise the length plus one
+                writer.uint(0 if values is None else len(values) + 1)
+                for value in values or ():
+                    writer.int(value)
+            writer.optional_int(self.rank)
+            writer.optional_str(self.tier)
+            writer.optional_int(self.num_teams)
+
+        @staticmethod
+        def _read_ints(reader: binary.BinaryReader) -> Optional[list[int]]:
+            length = reader.uint()
+            if not length:
+                return None
+            return [reader.int() for _ in range(length - 1)]
+
+        @staticmethod
+        def read_binary(reader: binary.BinaryReader) -> PlayerDetails.MmrChange:
+            return PlayerDetails.MmrChange(
+                change_id=reader.optional_int(),
+                new_mmr=reader.int(),
+                mmr_delta=reader.int(),
+                reason=reader.enum(PlayerDetails.MmrChange.Reason),
+                time=reader.datetime(),
+                score=reader.optional_int(),
+                partner_scores=PlayerDetails.MmrChange._read_ints(reader),
+                partner_ids=PlayerDetails.MmrChange._read_ints(reader),
+                rank=reader.optional_int(),
+                tier=reader.optional_str(),
+                num_teams=reader.optional_int()
+            )
 
         class Reason(Enum):
             PLACEMENT = 'Placement'
@@ -222,9 +472,23 @@ class PlayerDetails:
         def loads(data: dict[str, Any]) -> PlayerDetails.NameChange:
             return PlayerDetails.NameChange(
                 name=data['name'],
-                changed_on=isoparse(data['changedOn'])
+                changed_on=parse_datetime(data['changedOn'])
             )
 
         @classmethod
         def loads_list(cls, data: list[dict[str, Any]]) -> PlayerDetails.NameChange:
             return list(map(lambda n: cls.loads(data=n), data))
+
+        def dumps(self) -> dict[str, Any]:
+            return {
+                'name': self.name,
+                'changedOn': binary.dump_datetime(self.changed_on)
+            }
+
+        def write_binary(self, writer: binary.BinaryWriter) -> None:
+            writer.str(self.name)
+            writer.datetime(self.changed_on)
+
+        @staticmethod
+        def read_binary(reader: binary.BinaryReader) -> PlayerDetails.NameChange:
+            return PlayerDetails.NameChange(name=reader.str(), changed_on=reader.datetime())
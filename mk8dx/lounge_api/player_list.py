@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Optional, Any
+from . import binary
 
 
 class PlayerList:
@@ -15,9 +16,30 @@ class PlayerList:
     @staticmethod
     def loads(data: dict[str, Any]) -> PlayerList:
         return PlayerList(
-            players=PlayerList.Player.loads_list(data=data)
+            players=PlayerList.Player.loads_list(data=data['players'])
         )
 
+    def dumps(self) -> dict[str, Any]:
+        return {'players': [player.dumps() for player in self.players]}
+
+    def write_binary(self, writer: binary.BinaryWriter) -> None:
+        writer.uint(len(self.players))
+        for player in self.players:
+            player.write_binary(writer)
+
+    @staticmethod
+    def read_binary(reader: binary.BinaryReader) -> PlayerList:
+        return PlayerList(
+            players=[PlayerList.Player.read_binary(reader) for _ in range(reader.uint())]
+        )
+
+    def to_bytes(self) -> bytes:
+        return binary.to_bytes(self, binary.PLAYER_LIST)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> PlayerList:
+        return binary.from_bytes(data, binary.PLAYER_LIST, PlayerList.read_binary)
+
     class Player:
 
         __slots__ = (
@@ -55,3 +77,29 @@ class PlayerList:
         @classmethod
         def loads_list(cls, data: list[dict[str, Any]]) -> list[PlayerList.Player]:
             return list(map(lambda p: cls.loads(p), data))
+
+        def dumps(self) -> dict[str, Any]:
+            return {
+                'name': self.name,
+                'mkcId': self.mkc_id,
+                'mmr': self.mmr,
+                'discordId': self.discord_id,
+                'eventsPlayed': self.events_played
+            }
+
+        def write_binary(self, writer: binary.BinaryWriter) -> None:
+            writer.str(self.name)
+            writer.int(self.mkc_id)
+            writer.optional_int(self.mmr)
+            writer.optional_str(self.discord_id)
+            writer.uint(self.events_played)
+
+        @staticmethod
+        def read_binary(reader: binary.BinaryReader) -> PlayerList.Player:
+            return PlayerList.Player(
+                name=reader.str(),
+                mkc_id=reader.int(),
+                mmr=reader.optional_int(),
+                discord_id=reader.optional_str(),
+                events_played=reader.uint()
+            )
@@ -1,7 +1,15 @@
 from __future__ import annotations, division
 
 from enum import Enum
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
+import bisect
+import math
+import numbers
+
+from . import binary
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class Rank:
@@ -25,9 +33,17 @@ class Rank:
             return self.division.value
         return f'{self.division.value} {self.level}'
 
+    @staticmethod
+    def get(division: Rank.Division, level: Optional[int] = None) -> Rank:
+        # shared instance per (division, level); callers must not mutate it
+        rank = _ranks.get((division, level))
+        if rank is None:
+            rank = _ranks.setdefault((division, level), Rank(division=division, level=level))
+        return rank
+
     @staticmethod
     def loads(data: dict[str, Union[str, int]]) -> Rank:
-        return Rank(
+        return Rank.get(
             division=Rank.Division(data['division']),
             level=data.get('level')
         )
@@ -38,8 +54,59 @@ class Rank:
             division, level = name.split(' ', maxsplit=1)
             if not level.isdecimal():
                 return None
-            return Rank(division=Rank.Division(division), level=int(level))
-        return Rank(division=Rank.Division(name))
+            return Rank.get(division=Rank.Division(division), level=int(level))
+        return Rank.get(division=Rank.Division(name))
+
+    @staticmethod
+    def register_thresholds(season: int, thresholds: Sequence[tuple[Rank, int]]) -> None:
+        # thresholds are (rank, minimum MMR) pairs
+        thresholds = sorted(
+            ((Rank.get(rank.division, rank.level), mmr) for rank, mmr in thresholds),
+            key=lambda threshold: threshold[1]
+        )
+        _thresholds[season] = (
+            tuple(threshold[0] for threshold in thresholds),
+            tuple(threshold[1] for threshold in thresholds)
+        )
+
+    @staticmethod
+    def thresholds(season: int) -> list[tuple[Rank, int]]:
+        ranks, mins = _season_thresholds(season)
+        return list(zip(ranks, mins))
+
+    @staticmethod
+    def from_mmr(
+        mmr: Union[int, float, None, np.ndarray, Sequence[Any]],
+        season: int
+    ) -> Any:
+        # scalars map to a Rank; arrays map to an object array of the same shape, with NaN
+        # (no MMR yet) becoming Placement
+        ranks, mins = _season_thresholds(season)
+        if mmr is None or isinstance(mmr, numbers.Real):
+            if mmr is None or math.isnan(mmr):
+                return Rank.get(Rank.Division.PLACEMENT)
+            return ranks[max(bisect.bisect_right(mins, mmr) - 1, 0)]
+        import numpy as np
+        values = np.asarray(mmr, dtype=np.float64)
+        indices = np.maximum(np.searchsorted(mins, values, side='right') - 1, 0)
+        table = np.empty(len(ranks) + 1, dtype=object)
+        table[:-1] = ranks
+        table[-1] = Rank.get(Rank.Division.PLACEMENT)
+        return table[np.where(np.isnan(values), len(ranks), indices)]
+
+    def dumps(self) -> dict[str, Union[str, int]]:
+        data: dict[str, Union[str, int]] = {'division': self.division.value}
+        if self.level is not None:
+            data['level'] = self.level
+        return data
+
+    def write_binary(self, writer: binary.BinaryWriter) -> None:
+        writer.enum(self.division)
+        writer.optional_int(self.level)
+
+    @staticmethod
+    def read_binary(reader: binary.BinaryReader) -> Rank:
+        return Rank.get(division=reader.enum(Rank.Division), level=reader.optional_int())
 
     def __str__(self) -> str:
         return self.name
@@ -57,3 +124,44 @@ class Rank:
         IRON = 'Iron'
         PLACEMENT = 'Placement'
         UNKNOWN = 'Unknown'
+
+
+_ranks: dict[tuple[Rank.Division, Optional[int]], Rank] = {}
+_thresholds: dict[int, tuple[tuple[Rank, ...], tuple[int, ...]]] = {}
+
+
+def _season_thresholds(season: int) -> tuple[tuple[Rank, ...], tuple[int, ...]]:
+    # there is no default season: labelling with another season's rules would be silently wrong
+    thresholds = _thresholds.get(season)
+    if thresholds is None:
+        raise ValueError(
+            f'no rank thresholds for season {season}, register them with Rank.register_thresholds'
+        )
+    return thresholds
+
+
+# the Lounge has used these divisions since season 8; earlier seasons had no Ruby and different
+# minimums, so they are left to register_thresholds
+for _season in range(8, 13):
+    Rank.register_thresholds(_season, [
+        (Rank(Rank.Division.IRON, 1), 0),
+        (Rank(Rank.Division.IRON, 2), 1000),
+        (Rank(Rank.Division.BRONZE, 1), 2000),
+        (Rank(Rank.Division.BRONZE, 2), 3000),
+        (Rank(Rank.Division.SILVER, 1), 4000),
+        (Rank(Rank.Division.SILVER, 2), 5000),
+        (Rank(Rank.Division.GOLD, 1), 6000),
+        (Rank(Rank.Division.GOLD, 2), 7000),
+        (Rank(Rank.Division.PLATINUM, 1), 8000),
+        (Rank(Rank.Division.PLATINUM, 2), 9000),
+        (Rank(Rank.Division.SAPPHIRE, 1), 10000),
+        (Rank(Rank.Division.SAPPHIRE, 2), 11000),
+        (Rank(Rank.Division.RUBY, 1), 12000),
+        (Rank(Rank.Division.RUBY, 2), 13000),
+        (Rank(Rank.Division.DIAMOND, 1), 14000),
+        (Rank(Rank.Division.DIAMOND, 2), 15000),
+        (Rank(Rank.Division.MASTER), 16000),
+        (Rank(Rank.Division.GRANDMASTER), 17000)
+    ])
+
+del _season
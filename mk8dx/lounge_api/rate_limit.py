@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import asyncio
+import random
+import time
+
+from .timestamp import to_utc
+
+
+class RateLimiter:
+
+    __slots__ = (
+        'rate',
+        'burst',
+        '_tokens',
+        '_updated_at',
+        '_resume_at',
+        '_lock'
+    )
+
+    def __init__(self, rate: float = 10.0, burst: int = 10) -> None:
+        self.rate: float = rate
+        self.burst: int = burst
+        self._tokens: float = burst
+        self._updated_at: float = time.monotonic()
+        self._resume_at: float = 0.0
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                    continue
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        # the server told us to slow down, so every request sharing this limiter waits
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+
+class RetryPolicy:
+
+    __slots__ = (
+        'max_retries',
+        'base_delay',
+        'max_delay',
+        'statuses'
+    )
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        statuses: tuple[int, ...] = (429, 502, 503, 504)
+    ) -> None:
+        self.max_retries: int = max_retries
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.statuses: tuple[int, ...] = statuses
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        # a Retry-After beyond max_delay is not retried at all, see LoungeClient._request
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    if value.isdecimal():
+        return float(value)
+    try:
+        # a '-0000' zone parses to a naive datetime, which HTTP dates mean as UTC
+        retry_at = to_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Optional
+from datetime import datetime
+
+from .bonus import Bonus
+from .penalty import Penalty
+
+
+class PlayerSanctions:
+
+    __slots__ = (
+        'name',
+        'season',
+        'penalties',
+        'bonuses',
+        'penalty_count',
+        'strike_count',
+        'penalty_amount',
+        'last_penalty_on',
+        'bonus_count',
+        'bonus_amount',
+        'last_bonus_on'
+    )
+
+    def __init__(
+        self,
+        name: str,
+        season: Optional[int],
+        penalties: list[Penalty],
+        bonuses: list[Bonus]
+    ) -> None:
+        self.name: str = name
+        self.season: Optional[int] = season
+        self.penalties: list[Penalty] = penalties
+        self.bonuses: list[Bonus] = bonuses
+        # deleted entries only appear when requested and never count towards the totals
+        active_penalties = [penalty for penalty in penalties if penalty.deleted_on is None]
+        active_bonuses = [bonus for bonus in bonuses if bonus.deleted_on is None]
+        self.penalty_count: int = len(active_penalties)
+        self.strike_count: int = sum(penalty.is_strike for penalty in active_penalties)
+        self.penalty_amount: int = sum(penalty.amount for penalty in active_penalties)
+        self.last_penalty_on: Optional[datetime] = max(
+            (penalty.awarded_on for penalty in active_penalties),
+            default=None
+        )
+        self.bonus_count: int = len(active_bonuses)
+        self.bonus_amount: int = sum(bonus.amount for bonus in active_bonuses)
+        self.last_bonus_on: Optional[datetime] = max(
+            (bonus.awarded_on for bonus in active_bonuses),
+            default=None
+        )
+
+    @property
+    def net_change(self) -> int:
+        # MMR change from all active penalties and bonuses, independent of the sign of amount
+        return sum(
+            entry.new_mmr - entry.prev_mmr
+            for entry in (*self.penalties, *self.bonuses)
+            if entry.deleted_on is None
+        )
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator
+import codecs
+import json
+import aiohttp
+
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',]'
+
+
+async def iter_json_array(stream: aiohttp.StreamReader, chunk_size: int = 65536) -> AsyncIterator[Any]:
+    # yields the elements of a top-level JSON array while the body is still being received,
+    # so only the current chunk and the element being decoded are held in memory
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    pos = 0
+    started = False
+    eof = False
+    while True:
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            if not started:
+                if char != '[':
+                    raise ValueError(f'expected a JSON array, got {char!r}')
+                started = True
+                pos += 1
+                continue
+            if char == ',':
+                pos += 1
+                continue
+            if char == ']':
+                return
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                break
+            complete = end < len(buffer) and buffer[end] in _DELIMITERS
+            if not complete and not isinstance(value, (dict, list)):
+                # a scalar is only complete once the delimiter after it has been received
+                if eof:
+                    raise ValueError('malformed JSON array')
+                break
+            yield value
+            pos = end
+        if eof:
+            raise ValueError('unterminated JSON array')
+        chunk = await stream.read(chunk_size)
+        if chunk:
+            buffer = buffer[pos:] + utf8.decode(chunk)
+        else:
+            buffer = buffer[pos:] + utf8.decode(b'', final=True)
+            eof = True
+        pos = 0
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union
+)
+import asyncio
+import threading
+
+from .player import Player
+from .player_details import PlayerDetails
+from .player_list import PlayerList
+from .leaderboard import Leaderboard
+from .table_details import TableDetails
+from .bonus import Bonus
+from .penalty import Penalty
+from .sanctions import PlayerSanctions
+from .client import LoungeClient
+from .rate_limit import RateLimiter
+
+T = TypeVar('T')
+
+
+class SyncLoungeClient:
+
+    __slots__ = (
+        'client',
+        '_loop',
+        '_thread'
+    )
+
+    def __init__(self, client: Optional[LoungeClient] = None) -> None:
+        # every request runs on one event loop owned by a daemon thread, so the pooled
+        # session of the wrapped client is reused across blocking calls
+        if client is None:
+            client = LoungeClient(rate_limiter=RateLimiter())
+        self.client: LoungeClient = client
+        self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._loop.run_forever,
+            name='SyncLoungeClient',
+            daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> SyncLoungeClient:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._loop.is_closed()
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._run(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        try:
+            while True:
+                try:
+                    yield self._run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._loop.is_closed():
+                self._run(iterator.aclose())
+
+    def map(
+        self,
+        function: Callable[..., Awaitable[T]],
+        *iterables: Iterable[Any],
+        return_exceptions: bool = False
+    ) -> list[Union[T, BaseException]]:
+        # function is called as function(client, *args), e.g. map(LoungeClient.get_table, ids)
+        async def gather() -> list[Union[T, BaseException]]:
+            return await asyncio.gather(
+                *(function(self.client, *args) for args in zip(*iterables)),
+                return_exceptions=return_exceptions
+            )
+
+        return self._run(gather())
+
+    def get(self, path: str, params: dict = {}) -> Optional[dict[str, Any]]:
+        return self._run(self.client.get(path=path, params=params))
+
+    def get_player(
+        self,
+        id=None,
+        name=None,
+        mkc_id=None,
+        discord_id=None,
+        fc=None,
+        season=None
+    ) -> Optional[Player]:
+        return self._run(self.client.get_player(
+            id=id,
+            name=name,
+            mkc_id=mkc_id,
+            discord_id=discord_id,
+            fc=fc,
+            season=season
+        ))
+
+    def get_player_details(self, id=None, name=None, season=None) -> Optional[PlayerDetails]:
+        return self._run(self.client.get_player_details(id=id, name=name, season=season))
+
+    def get_player_list(self, min_mmr=None, max_mmr=None, season=None) -> Optional[PlayerList]:
+        return self._run(self.client.get_player_list(min_mmr=min_mmr, max_mmr=max_mmr, season=season))
+
+    def get_leaderboard(
+        self,
+        season: int,
+        skip: int = 0,
+        page_size: int = 50,
+        search=None,
+        country=None,
+        min_mmr=None,
+        max_mmr=None,
+        min_events_played=None,
+        max_events_played=None
+    ) -> Optional[Leaderboard]:
+        return self._run(self.client.get_leaderboard(
+            season=season,
+            skip=skip,
+            page_size=page_size,
+            search=search,
+            country=country,
+            min_mmr=min_mmr,
+            max_mmr=max_mmr,
+            min_events_played=min_events_played,
+            max_events_played=max_events_played
+        ))
+
+    def iter_leaderboard(
+        self,
+        season: int,
+        page_size: int = 100,
+        search=None,
+        country=None,
+        min_mmr=None,
+        max_mmr=None,
+        min_events_played=None,
+        max_events_played=None,
+        prefetch: int = 4
+    ) -> Iterator[Leaderboard.Player]:
+        return self._iterate(self.client.iter_leaderboard(
+            season=season,
+            page_size=page_size,
+            search=search,
+            country=country,
+            min_mmr=min_mmr,
+            max_mmr=max_mmr,
+            min_events_played=min_events_played,
+            max_events_played=max_events_played,
+            prefetch=prefetch
+        ))
+
+    def get_table(self, table_id: int, refresh: bool = False) -> Optional[TableDetails]:
+        return self._run(self.client.get_table(table_id=table_id, refresh=refresh))
+
+    def get_tables(
+        self,
+        table_ids: Iterable[int],
+        concurrency: int = 8,
+        refresh: bool = False
+    ) -> list[Union[TableDetails, None, BaseException]]:
+        return self._run(self.client.get_tables(
+            table_ids=table_ids,
+            concurrency=concurrency,
+            refresh=refresh
+        ))
+
+    def get_list(self, after=None, before=None, season=None) -> Optional[list[TableDetails]]:
+        return self._run(self.client.get_list(after=after, before=before, season=season))
+
+    def iter_list(self, after=None, before=None, season=None) -> Iterator[TableDetails]:
+        return self._iterate(self.client.iter_list(after=after, before=before, season=season))
+
+    def get_table_unverified(self, season=None) -> Optional[list[TableDetails]]:
+        return self._run(self.client.get_table_unverified(season=season))
+
+    def iter_table_unverified(self, season=None) -> Iterator[TableDetails]:
+        return self._iterate(self.client.iter_table_unverified(season=season))
+
+    def get_bonus(self, id: int) -> Optional[Bonus]:
+        return self._run(self.client.get_bonus(id=id))
+
+    def get_bonus_list(
+        self,
+        name: str,
+        season=None
+    ) -> Optional[list[Bonus]]:
+        return self._run(self.client.get_bonus_list(name=name, season=season))
+
+    def get_penalty(self, id: int) -> Optional[Penalty]:
+        return self._run(self.client.get_penalty(id=id))
+
+    def get_penalty_list(
+        self,
+        name: str,
+        is_strike: Optional[bool] = None,
+        after=None,
+        include_deleted=False,
+        season=None
+    ) -> Optional[list[Penalty]]:
+        return self._run(self.client.get_penalty_list(
+            name=name,
+            is_strike=is_strike,
+            after=after,
+            include_deleted=include_deleted,
+            season=season
+        ))
+
+    def get_sanctions(
+        self,
+        names: Iterable[str],
+        season=None,
+        include_deleted=False,
+        concurrency: int = 8
+    ) -> dict[str, Union[PlayerSanctions, None, BaseException]]:
+        return self._run(self.client.get_sanctions(
+            names=names,
+            season=season,
+            include_deleted=include_deleted,
+            concurrency=concurrency
+        ))
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional
-from dateutil.parser import isoparse
+from typing import Any, Iterator, Optional
+from .timestamp import parse_datetime
+from .decode import DecodeContext
+from . import binary
 
 
 class TableDetails:
@@ -16,7 +18,9 @@ class TableDetails:
         'num_teams',
         'url',
         'tier',
-        'teams',
+        '_teams',
+        '_teams_data',
+        '_context',
         'table_message_id',
         'update_message_id',
         'author_id'
@@ -45,41 +49,180 @@ class TableDetails:
         self.num_teams: int = num_teams
         self.url: str = url
         self.tier: str = tier
-        self.teams: list[TableDetails.Team] = teams
+        self.teams = teams
         self.table_message_id: Optional[str] = table_message_id
         self.update_message_id: Optional[str] = update_message_id
         self.author_id: Optional[str] = author_id
 
+    @property
+    def teams(self) -> list[TableDetails.Team]:
+        if self._teams is None:
+            self._teams = TableDetails.Team.loads_list(data=self._teams_data, context=self._context)
+            self._teams_data = None
+            self._context = None
+        return self._teams
+
+    @teams.setter
+    def teams(self, teams: list[TableDetails.Team]) -> None:
+        self._teams: Optional[list[TableDetails.Team]] = teams
+        self._teams_data: Optional[list[dict[str, Any]]] = None
+        # the context of loads, kept until the teams are materialized so they share its strings
+        self._context: Optional[DecodeContext] = None
+
+    def score_rows(self) -> Iterator[tuple[Any, ...]]:
+        # (team_index, team_rank, score_index, score, multiplier, prev_mmr, new_mmr, delta,
+        # player_id, player_name, player_discord_id, player_country_code) for every score, read
+        # from the raw data while the teams are unmaterialized so that lazy tables stay lazy
+        if self._teams is None:
+            for team_index, team in enumerate(self._teams_data):
+                for score_index, score in enumerate(team['scores']):
+                    yield (
+                        team_index,
+                        team['rank'],
+                        score_index,
+                        score['score'],
+                        score['multiplier'],
+                        score.get('prevMmr'),
+                        score.get('newMmr'),
+                        score.get('delta'),
+                        score['playerId'],
+                        score['playerName'],
+                        score.get('playerDiscordId'),
+                        score.get('playerCountryCode')
+                    )
+            return
+        for team_index, team in enumerate(self._teams):
+            for score_index, score in enumerate(team.scores):
+                yield (
+                    team_index,
+                    team.rank,
+                    score_index,
+                    score.score,
+                    score.multiplier,
+                    score.prev_mmr,
+                    score.new_mmr,
+                    score.delta,
+                    score.player_id,
+                    score.player_name,
+                    score.player_discord_id,
+                    score.player_country_code
+                )
+
     @staticmethod
-    def loads(data: dict[str, Any]) -> TableDetails:
+    def loads(
+        data: dict[str, Any],
+        lazy: bool = False,
+        context: Optional[DecodeContext] = None
+    ) -> TableDetails:
+        if context is None:
+            context = DecodeContext()
         verified_on_text = data.get('verifiedOn')
         deleted_on_text = data.get('deletedOn')
         if verified_on_text is None:
             verified_on = None
         else:
-            verified_on = isoparse(verified_on_text)
+            verified_on = parse_datetime(verified_on_text)
         if deleted_on_text is None:
             deleted_on = None
         else:
-            deleted_on = isoparse(deleted_on_text)
-        return TableDetails(
+            deleted_on = parse_datetime(deleted_on_text)
+        table = TableDetails(
             id=data['id'],
             season=data['season'],
-            created_on=isoparse(data['createdOn']),
+            created_on=parse_datetime(data['createdOn']),
             verified_on=verified_on,
             deleted_on=deleted_on,
             num_teams=data['numTeams'],
             url=data['url'],
-            tier=data['tier'],
-            teams=TableDetails.Team.loads_list(data=data['teams']),
+            tier=context.str(data['tier']),
+            teams=[] if lazy else TableDetails.Team.loads_list(data=data['teams'], context=context),
             table_message_id=data.get('tableMessageId'),
             update_message_id=data.get('updateMessageId'),
-            author_id=data.get('authorId')
+            author_id=context.str(data.get('authorId'))
         )
+        if lazy:
+            # converted to model objects on first access
+            table._teams, table._teams_data, table._context = None, data['teams'], context
+        return table
 
     @classmethod
-    def loads_list(cls, data: list[dict[str, Any]]) -> list[TableDetails]:
-        return list(map(lambda t: cls.loads(t), data))
+    def loads_list(
+        cls,
+        data: list[dict[str, Any]],
+        lazy: bool = False,
+        context: Optional[DecodeContext] = None
+    ) -> list[TableDetails]:
+        if context is None:
+            context = DecodeContext()
+        return list(map(lambda t: cls.loads(t, lazy=lazy, context=context), data))
+
+    def dumps(self) -> dict[str, Any]:
+        return {
+            'id': self.id,
+            'season': self.season,
+            'createdOn': binary.dump_datetime(self.created_on),
+            'verifiedOn': binary.dump_datetime(self.verified_on),
+            'deletedOn': binary.dump_datetime(self.deleted_on),
+            'numTeams': self.num_teams,
+            'url': self.url,
+            'tier': self.tier,
+            'teams': [team.dumps() for team in self.teams],
+            'tableMessageId': self.table_message_id,
+            'updateMessageId': self.update_message_id,
+            'authorId': self.author_id
+        }
+
+    def write_binary(self, writer: binary.BinaryWriter) -> None:
+        writer.uint(self.id)
+        writer.uint(self.season)
+        writer.datetime(self.created_on)
+        writer.optional_datetime(self.verified_on)
+        writer.optional_datetime(self.deleted_on)
+        writer.uint(self.num_teams)
+        writer.str(self.url)
+        writer.str(self.tier)
+        writer.uint(len(self.teams))
+        for team in self.teams:
+            team.write_binary(writer)
+        writer.optional_str(self.table_message_id)
+        writer.optional_str(self.update_message_id)
+        writer.optional_str(self.author_id)
+
+    @staticmethod
+    def read_binary(reader: binary.BinaryReader) -> TableDetails:
+        return TableDetails(
+            id=reader.uint(),
+            season=reader.uint(),
+            created_on=reader.datetime(),
+            verified_on=reader.optional_datetime(),
+            deleted_on=reader.optional_datetime(),
+            num_teams=reader.uint(),
+            url=reader.str(),
+            tier=reader.str(),
+            teams=[TableDetails.Team.read_binary(reader) for _ in range(reader.uint())],
+            table_message_id=reader.optional_str(),
+            update_message_id=reader.optional_str(),
+            author_id=reader.optional_str()
+        )
+
+    def to_bytes(self) -> bytes:
+        return binary.to_bytes(self, binary.TABLE_DETAILS)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> TableDetails:
+        return binary.from_bytes(data, binary.TABLE_DETAILS, TableDetails.read_binary)
+
+    @staticmethod
+    def to_bytes_list(values: list[TableDetails]) -> bytes:
+        return binary.to_bytes_list(values, binary.TABLE_DETAILS)
+
+    @staticmethod
+    def from_bytes_list(data: bytes) -> list[TableDetails]:
+        return binary.from_bytes_list(data, binary.TABLE_DETAILS, TableDetails.read_binary)
+
+    @staticmethod
+    def iter_bytes_list(data: bytes) -> Iterator[TableDetails]:
+        return binary.iter_bytes_list(data, binary.TABLE_DETAILS, TableDetails.read_binary)
 
     class Team:
 
@@ -97,15 +240,40 @@ class TableDetails:
             self.scores: list[TableDetails.Score] = scores
 
         @staticmethod
-        def loads(data: dict[str, Any]) -> TableDetails.Team:
+        def loads(data: dict[str, Any], context: Optional[DecodeContext] = None) -> TableDetails.Team:
             return TableDetails.Team(
                 rank=data['rank'],
-                scores=TableDetails.Score.loads_list(data=data['scores'])
+                scores=TableDetails.Score.loads_list(data=data['scores'], context=context)
             )
 
         @classmethod
-        def loads_list(cls, data: list[dict[str, Any]]) -> list[TableDetails.Team]:
-            return list(map(lambda t: cls.loads(t), data))
+        def loads_list(
+            cls,
+            data: list[dict[str, Any]],
+            context: Optional[DecodeContext] = None
+        ) -> list[TableDetails.Team]:
+            if context is None:
+                context = DecodeContext()
+            return list(map(lambda t: cls.loads(t, context=context), data))
+
+        def dumps(self) -> dict[str, Any]:
+            return {
+                'rank': self.rank,
+                'scores': [score.dumps() for score in self.scores]
+            }
+
+        def write_binary(self, writer: binary.BinaryWriter) -> None:
+            writer.uint(self.rank)
+            writer.uint(len(self.scores))
+            for score in self.scores:
+                score.write_binary(writer)
+
+        @staticmethod
+        def read_binary(reader: binary.BinaryReader) -> TableDetails.Team:
+            return TableDetails.Team(
+                rank=reader.uint(),
+                scores=[TableDetails.Score.read_binary(reader) for _ in range(reader.uint())]
+            )
 
     class Score:
 
@@ -144,7 +312,9 @@ class TableDetails:
             self.player_country_code: Optional[str] = player_country_code
 
         @staticmethod
-        def loads(data: dict[str, Any]) -> TableDetails.Score:
+        def loads(data: dict[str, Any], context: Optional[DecodeContext] = None) -> TableDetails.Score:
+            if context is None:
+                context = DecodeContext()
             return TableDetails.Score(
                 score=data['score'],
                 multiplier=data['multiplier'],
@@ -152,11 +322,55 @@ class TableDetails:
                 new_mmr=data.get('newMmr'),
                 delta=data.get('delta'),
                 player_id=data['playerId'],
-                player_name=data['playerName'],
-                player_discord_id=data.get('playerDiscordId'),
-                player_country_code=data.get('playerCountryCode')
+                player_name=context.str(data['playerName']),
+                player_discord_id=context.str(data.get('playerDiscordId')),
+                player_country_code=context.str(data.get('playerCountryCode'))
             )
 
         @classmethod
-        def loads_list(cls, data: list[dict[str, Any]]) -> list[TableDetails.Score]:
-            return list(map(lambda s: cls.loads(s), data))
+        def loads_list(
+            cls,
+            data: list[dict[str, Any]],
+            context: Optional[DecodeContext] = None
+        ) -> list[TableDetails.Score]:
+            if context is None:
+                context = DecodeContext()
+            return list(map(lambda s: cls.loads(s, context=context), data))
+
+        def dumps(self) -> dict[str, Any]:
+            return {
+                'score': self.score,
+                'multiplier': self.multiplier,
+                'prevMmr': self.prev_mmr,
+                'newMmr': self.new_mmr,
+                'delta': self.delta,
+                'playerId': self.player_id,
+                'playerName': self.player_name,
+                'playerDiscordId': self.player_discord_id,
+                'playerCountryCode': self.player_country_code
+            }
+
+        def write_binary(self, writer: binary.BinaryWriter) -> None:
+            writer.int(self.score)
+            writer.float(self.multiplier)
+            writer.optional_int(self.prev_mmr)
+            writer.optional_int(self.new_mmr)
+            writer.optional_int(self.delta)
+            writer.uint(self.player_id)
+            writer.str(self.player_name)
+            writer.optional_str(self.player_discord_id)
+            writer.optional_str(self.player_country_code)
+
+        @staticmethod
+        def read_binary(reader: binary.BinaryReader) -> TableDetails.Score:
+            return TableDetails.Score(
+                score=reader.int(),
+                multiplier=reader.float(),
+                prev_mmr=reader.optional_int(),
+                new_mmr=reader.optional_int(),
+                delta=reader.optional_int(),
+                player_id=reader.uint(),
+                player_name=reader.str(),
+                player_discord_id=reader.optional_str(),
+                player_country_code=reader.optional_str()
+            )
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+from datetime import datetime
+import sqlite3
+
+from .table_details import TableDetails
+from .timestamp import to_utc
+
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS tables (
+    id INTEGER PRIMARY KEY,
+    season INTEGER NOT NULL,
+    created_on TEXT NOT NULL,
+    verified_on TEXT,
+    deleted_on TEXT,
+    num_teams INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    table_message_id TEXT,
+    update_message_id TEXT,
+    author_id TEXT
+);
+CREATE TABLE IF NOT EXISTS scores (
+    table_id INTEGER NOT NULL REFERENCES tables(id) ON DELETE CASCADE,
+    team_index INTEGER NOT NULL,
+    team_rank INTEGER NOT NULL,
+    score_index INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    multiplier REAL NOT NULL,
+    prev_mmr INTEGER,
+    new_mmr INTEGER,
+    delta INTEGER,
+    player_id INTEGER NOT NULL,
+    player_name TEXT NOT NULL,
+    player_discord_id TEXT,
+    player_country_code TEXT,
+    PRIMARY KEY (table_id, team_index, score_index)
+);
+CREATE INDEX IF NOT EXISTS scores_player_id ON scores (player_id);
+CREATE INDEX IF NOT EXISTS tables_created_on ON tables (created_on);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+'''
+
+
+def _dump_datetime(value: Optional[datetime]) -> Optional[str]:
+    # stored and compared as text, which only orders correctly when every value is in UTC
+    if value is None:
+        return None
+    return to_utc(value).isoformat(timespec='microseconds')
+
+
+def _load_datetime(text: Optional[str]) -> Optional[datetime]:
+    if text is None:
+        return None
+    return datetime.fromisoformat(text)
+
+
+class TableStore:
+
+    __slots__ = (
+        'path',
+        '_connection'
+    )
+
+    def __init__(self, path: str = ':memory:') -> None:
+        self.path: str = path
+        self._connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> TableStore:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute('SELECT COUNT(*) FROM tables').fetchone()[0]
+
+    def __contains__(self, table_id: int) -> bool:
+        row = self._connection.execute('SELECT 1 FROM tables WHERE id = ?', (table_id,)).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        self._connection.close()
+
+    @staticmethod
+    def is_immutable(table: TableDetails) -> bool:
+        return table.verified_on is not None and table.deleted_on is None
+
+    def get(self, table_id: int) -> Optional[TableDetails]:
+        row = self._connection.execute(
+            'SELECT id, season, created_on, verified_on, deleted_on, num_teams, url, tier, '
+            'table_message_id, update_message_id, author_id FROM tables WHERE id = ?',
+            (table_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        teams: list[TableDetails.Team] = []
+        team_index = -1
+        for score_row in self._connection.execute(
+            'SELECT team_index, team_rank, score, multiplier, prev_mmr, new_mmr, delta, player_id, '
+            'player_name, player_discord_id, player_country_code FROM scores '
+            'WHERE table_id = ? ORDER BY team_index, score_index',
+            (table_id,)
+        ):
+            if score_row[0] != team_index:
+                team_index = score_row[0]
+                teams.append(TableDetails.Team(rank=score_row[1], scores=[]))
+            teams[-1].scores.append(TableDetails.Score(
+                score=score_row[2],
+                multiplier=score_row[3],
+                prev_mmr=score_row[4],
+                new_mmr=score_row[5],
+                delta=score_row[6],
+                player_id=score_row[7],
+                player_name=score_row[8],
+                player_discord_id=score_row[9],
+                player_country_code=score_row[10]
+            ))
+        return TableDetails(
+            id=row[0],
+            season=row[1],
+            created_on=_load_datetime(row[2]),
+            verified_on=_load_datetime(row[3]),
+            deleted_on=_load_datetime(row[4]),
+            num_teams=row[5],
+            url=row[6],
+            tier=row[7],
+            teams=teams,
+            table_message_id=row[8],
+            update_message_id=row[9],
+            author_id=row[10]
+        )
+
+    def statuses(
+        self,
+        after: Optional[datetime] = None,
+        before: Optional[datetime] = None
+    ) -> dict[int, tuple[Optional[datetime], Optional[datetime]]]:
+        # (verified_on, deleted_on) of every stored table created in [after, before)
+        rows = self._connection.execute(
+            'SELECT id, verified_on, deleted_on FROM tables '
+            'WHERE (:after IS NULL OR created_on >= :after) '
+            'AND (:before IS NULL OR created_on < :before)',
+            {'after': _dump_datetime(after), 'before': _dump_datetime(before)}
+        )
+        return {row[0]: (_load_datetime(row[1]), _load_datetime(row[2])) for row in rows}
+
+    def verified_statuses(
+        self,
+        after_id: int = 0,
+        limit: Optional[int] = None
+    ) -> dict[int, tuple[Optional[datetime], Optional[datetime]]]:
+        # (verified_on, deleted_on) of stored verified, undeleted tables with id > after_id, by id
+        rows = self._connection.execute(
+            'SELECT id, verified_on, deleted_on FROM tables '
+            'WHERE verified_on IS NOT NULL AND deleted_on IS NULL AND id > ? ORDER BY id LIMIT ?',
+            (after_id, -1 if limit is None else limit)
+        )
+        return {row[0]: (_load_datetime(row[1]), _load_datetime(row[2])) for row in rows}
+
+    def pending_ids(self) -> list[int]:
+        rows = self._connection.execute(
+            'SELECT id FROM tables WHERE verified_on IS NULL AND deleted_on IS NULL ORDER BY id'
+        )
+        return [row[0] for row in rows]
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._connection.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def set_meta(self, key: str, value: Optional[str]) -> None:
+        with self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, value))
+
+    def put(self, table: TableDetails) -> None:
+        self.put_many((table,))
+
+    def put_many(self, tables: Iterable[TableDetails]) -> None:
+        with self._connection:
+            for table in tables:
+                self._connection.execute('DELETE FROM scores WHERE table_id = ?', (table.id,))
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO tables VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        table.id,
+                        table.season,
+                        _dump_datetime(table.created_on),
+                        _dump_datetime(table.verified_on),
+                        _dump_datetime(table.deleted_on),
+                        table.num_teams,
+                        table.url,
+                        table.tier,
+                        table.table_message_id,
+                        table.update_message_id,
+                        table.author_id
+                    )
+                )
+                self._connection.executemany(
+                    'INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(table.id, *row) for row in table.score_rows()]
+                )
+
+    def delete(self, table_id: int) -> None:
+        with self._connection:
+            self._connection.execute('DELETE FROM tables WHERE id = ?', (table_id,))
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+
+from .client import LoungeClient
+from .table_details import TableDetails
+from .table_store import TableStore
+from .timestamp import to_utc
+
+
+class TableSyncResult:
+
+    __slots__ = (
+        'added',
+        'verified',
+        'deleted',
+        'updated',
+        'watermark'
+    )
+
+    def __init__(self, watermark: Optional[datetime] = None) -> None:
+        self.added: list[int] = []
+        self.verified: list[int] = []
+        self.deleted: list[int] = []
+        self.updated: list[int] = []
+        self.watermark: Optional[datetime] = watermark
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.verified or self.deleted or self.updated)
+
+
+class TableSync:
+
+    __slots__ = (
+        'client',
+        'store',
+        'season',
+        'start',
+        'window',
+        'overlap',
+        'recheck'
+    )
+
+    def __init__(
+        self,
+        client: LoungeClient,
+        store: TableStore,
+        season: Optional[int] = None,
+        start: Optional[datetime] = None,
+        window: timedelta = timedelta(days=1),
+        overlap: timedelta = timedelta(hours=6),
+        recheck: int = 100
+    ) -> None:
+        self.client: LoungeClient = client
+        self.store: TableStore = store
+        self.season: Optional[int] = season
+        self.start: Optional[datetime] = None if start is None else to_utc(start)
+        self.window: timedelta = window
+        self.overlap: timedelta = overlap
+        # held verified tables fetched again per run, round-robin by id, to notice deletions of
+        # tables older than the rescanned overlap
+        self.recheck: int = recheck
+
+    @property
+    def _watermark_key(self) -> str:
+        return f'table_sync.watermark.{self.season}'
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        text = self.store.get_meta(self._watermark_key)
+        if text is None:
+            return None
+        return to_utc(datetime.fromisoformat(text))
+
+    @watermark.setter
+    def watermark(self, watermark: Optional[datetime]) -> None:
+        self.store.set_meta(self._watermark_key, None if watermark is None else watermark.isoformat())
+
+    @property
+    def _recheck_key(self) -> str:
+        return f'table_sync.recheck.{self.season}'
+
+    @staticmethod
+    def _apply(
+        table: TableDetails,
+        known: Optional[tuple[Optional[datetime], Optional[datetime]]],
+        result: TableSyncResult
+    ) -> bool:
+        if known is None:
+            result.added.append(table.id)
+        elif known == (table.verified_on, table.deleted_on):
+            return False
+        elif table.deleted_on is not None:
+            result.deleted.append(table.id)
+        elif table.verified_on is not None and known[0] is None:
+            result.verified.append(table.id)
+        else:
+            result.updated.append(table.id)
+        return True
+
+    async def run(self, until: Optional[datetime] = None) -> TableSyncResult:
+        # created_on of the newest table seen is persisted as the high-water mark; each run
+        # rescans `overlap` before it to pick up late verifications and deletions
+        watermark = self.watermark
+        if watermark is None:
+            if self.start is None:
+                raise ValueError('start is required for the first sync')
+            after = self.start
+        else:
+            after = watermark - self.overlap
+        until = datetime.now(timezone.utc) if until is None else to_utc(until)
+        result = TableSyncResult(watermark=watermark)
+        checked: set[int] = set()
+        while after < until:
+            before = min(after + self.window, until)
+            known = self.store.statuses(after=after, before=before)
+            tables = await self.client.get_list(
+                after=after.isoformat(),
+                before=before.isoformat(),
+                season=self.season
+            ) or []
+            listed = {table.id for table in tables}
+            changed = [table for table in tables if self._apply(table, known.get(table.id), result)]
+            self.store.put_many(changed)
+            # a held table that is no longer listed may have been deleted
+            await self._recheck([id for id in known if id not in listed], known, result)
+            checked.update(listed)
+            checked.update(known)
+            for table in tables:
+                if result.watermark is None or result.watermark < table.created_on:
+                    result.watermark = table.created_on
+            if result.watermark is not None:
+                self.watermark = result.watermark
+            after = before
+        pending = [id for id in self.store.pending_ids() if id not in checked]
+        await self._recheck(pending, dict.fromkeys(pending, (None, None)), result)
+        await self._recheck_verified(checked, result)
+        return result
+
+    async def _recheck_verified(self, checked: set[int], result: TableSyncResult) -> None:
+        if self.recheck <= 0:
+            return
+        cursor = int(self.store.get_meta(self._recheck_key) or 0)
+        known = self.store.verified_statuses(after_id=cursor, limit=self.recheck)
+        # start over from the lowest id once the end has been reached
+        self.store.set_meta(self._recheck_key, str(max(known)) if len(known) == self.recheck else None)
+        table_ids = [id for id in known if id not in checked]
+        await self._recheck(table_ids, known, result)
+
+    async def _recheck(
+        self,
+        table_ids: list[int],
+        known: dict[int, tuple[Optional[datetime], Optional[datetime]]],
+        result: TableSyncResult
+    ) -> None:
+        if not table_ids:
+            return
+        changed = []
+        for table_id, table in zip(table_ids, await self.client.get_tables(table_ids, refresh=True)):
+            if isinstance(table, BaseException):
+                continue
+            if table is None:
+                self.store.delete(table_id)
+                result.deleted.append(table_id)
+            elif self._apply(table, known[table_id], result):
+                changed.append(table)
+        self.store.put_many(changed)
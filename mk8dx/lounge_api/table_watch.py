@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Optional
+from enum import Enum
+from functools import partial
+import asyncio
+import logging
+import aiohttp
+
+from .client import LoungeAPIError, LoungeAPIThrottledError, LoungeClient
+from .table_details import TableDetails
+
+_logger = logging.getLogger(__name__)
+
+
+class TableEvent:
+
+    __slots__ = (
+        'kind',
+        'table_id',
+        'table'
+    )
+
+    def __init__(
+        self,
+        kind: TableEvent.Kind,
+        table_id: int,
+        table: Optional[TableDetails]
+    ) -> None:
+        self.kind: TableEvent.Kind = kind
+        self.table_id: int = table_id
+        # None only for a table that was deleted and is no longer served at all
+        self.table: Optional[TableDetails] = table
+
+    def __repr__(self) -> str:
+        return f'TableEvent(kind={self.kind.value!r}, table_id={self.table_id})'
+
+    class Kind(Enum):
+        NEW = 'new'
+        UPDATED = 'updated'
+        VERIFIED = 'verified'
+        DELETED = 'deleted'
+
+
+class TableWatcher:
+
+    __slots__ = (
+        'client',
+        'season',
+        'min_interval',
+        'max_interval',
+        'backoff',
+        'initial',
+        'interval',
+        '_raw',
+        '_tables',
+        '_started'
+    )
+
+    def __init__(
+        self,
+        client: LoungeClient,
+        season: Optional[int] = None,
+        min_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        initial: bool = True
+    ) -> None:
+        self.client: LoungeClient = client
+        self.season: Optional[int] = season
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.backoff: float = backoff
+        # whether tables already pending at the first poll are reported as new
+        self.initial: bool = initial
+        self.interval: float = min_interval
+        self._raw: dict[int, dict[str, Any]] = {}
+        self._tables: dict[int, TableDetails] = {}
+        self._started: bool = False
+
+    @property
+    def tables(self) -> list[TableDetails]:
+        return list(self._tables.values())
+
+    def __aiter__(self) -> AsyncIterator[TableEvent]:
+        return self.events()
+
+    async def poll(self) -> list[TableEvent]:
+        params = {}
+        if self.season is not None:
+            params['season'] = self.season
+        data = await self.client.get(path='/table/unverified', params=params)
+        raw = {item['id']: item for item in data or []}
+        loads = partial(TableDetails.loads, lazy=self.client.lazy)
+        events: list[TableEvent] = []
+        tables: dict[int, TableDetails] = {}
+        for table_id, item in raw.items():
+            previous = self._raw.get(table_id)
+            # comparing the raw dicts is much cheaper than parsing, so unchanged tables are reused
+            if previous == item:
+                tables[table_id] = self._tables[table_id]
+                continue
+            table = loads(item)
+            tables[table_id] = table
+            if previous is not None:
+                events.append(TableEvent(kind=TableEvent.Kind.UPDATED, table_id=table_id, table=table))
+            elif self._started or self.initial:
+                events.append(TableEvent(kind=TableEvent.Kind.NEW, table_id=table_id, table=table))
+        gone = [table_id for table_id in self._raw if table_id not in raw]
+        if gone:
+            results = await self.client.get_tables(gone, refresh=True)
+            for table_id, result in zip(gone, results):
+                kind: Optional[TableEvent.Kind] = None
+                if result is None or (not isinstance(result, BaseException) and result.deleted_on):
+                    kind = TableEvent.Kind.DELETED
+                elif not isinstance(result, BaseException) and result.verified_on:
+                    kind = TableEvent.Kind.VERIFIED
+                if kind is not None:
+                    events.append(TableEvent(kind=kind, table_id=table_id, table=result))
+                else:
+                    # failed to load or still pending, so the next poll asks again
+                    tables[table_id] = self._tables[table_id]
+                    raw[table_id] = self._raw[table_id]
+        self._raw = raw
+        self._tables = tables
+        self._started = True
+        return events
+
+    async def events(self) -> AsyncIterator[TableEvent]:
+        while True:
+            try:
+                events = await self.poll()
+            except (LoungeAPIError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # a dashboard stream should outlive outages, so every failure backs off and polls
+                # again, but never sooner than the server asked for
+                retry_after = e.retry_after if isinstance(e, LoungeAPIThrottledError) else None
+                self.interval = max(
+                    min(self.interval * self.backoff, self.max_interval),
+                    retry_after or 0.0
+                )
+                _logger.warning(
+                    'polling unverified tables failed, retrying in %.1f s',
+                    self.interval,
+                    exc_info=True
+                )
+                events = []
+            else:
+                # poll quickly while staff are working through tables, back off when idle
+                if events:
+                    self.interval = self.min_interval
+                else:
+                    self.interval = min(self.interval * self.backoff, self.max_interval)
+            for event in events:
+                yield event
+            await asyncio.sleep(self.interval)
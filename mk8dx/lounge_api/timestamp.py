@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from dateutil.parser import isoparse
+
+
+def parse_datetime(text: str) -> datetime:
+    # the Lounge API emits 'YYYY-MM-DDTHH:MM:SS[.f{1,7}](Z|+HH:MM)', which datetime.fromisoformat
+    # accepts once the UTC designator and fraction are normalized; anything else goes to isoparse
+    try:
+        if text[-1:] == 'Z':
+            text = text[:-1] + '+00:00'
+        if len(text) > 19 and text[19] == '.':
+            offset = max(text.find('+', 20), text.find('-', 20))
+            if offset == -1:
+                offset = len(text)
+            if offset != 26:
+                text = text[:20] + text[20:offset][:6].ljust(6, '0') + text[offset:]
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return isoparse(text)
+
+
+def to_utc(value: datetime) -> datetime:
+    # naive datetimes are taken to be UTC, like the timestamps of the Lounge API itself
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
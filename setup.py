@@ -20,6 +20,7 @@ setup(
     license='MIT',
     description='To help to develop something about mk8dx',
     install_requires=requirements,
+    extras_require={'numpy': ['numpy']},
     long_description=readme,
     long_description_content_type='text/markdown'
 )
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from mk8dx.lounge_api import Penalty
+from mk8dx.lounge_api import binary
+from mk8dx.lounge_api.fake_server import FakeLoungeData
+
+
+SAMPLES = FakeLoungeData(num_players=40, num_tables=40).models()
+LIST_MODELS = [name for name, (model, _) in SAMPLES.items() if hasattr(model, 'to_bytes_list')]
+
+
+@pytest.mark.parametrize('name', SAMPLES)
+def test_bytes_round_trip(name: str) -> None:
+    model, values = SAMPLES[name]
+    for value in values:
+        assert model.from_bytes(value.to_bytes()).dumps() == value.dumps()
+
+
+@pytest.mark.parametrize('name', SAMPLES)
+def test_dumps_round_trip(name: str) -> None:
+    model, values = SAMPLES[name]
+    for value in values:
+        assert model.loads(value.dumps()).dumps() == value.dumps()
+
+
+@pytest.mark.parametrize('name', LIST_MODELS)
+def test_bytes_list_round_trip(name: str) -> None:
+    model, values = SAMPLES[name]
+    data = model.to_bytes_list(values)
+    expected = [value.dumps() for value in values]
+    assert [value.dumps() for value in model.from_bytes_list(data)] == expected
+    assert [value.dumps() for value in model.iter_bytes_list(data)] == expected
+
+
+def test_wrong_type_code() -> None:
+    with pytest.raises(ValueError):
+        Penalty.from_bytes(SAMPLES['Bonus'][1][0].to_bytes())
+
+
+def test_missing_required_string() -> None:
+    writer = binary.BinaryWriter()
+    writer.optional_str('unused')
+    writer.optional_str(None)
+    reader = binary.BinaryReader(writer.getvalue(binary.PLAYER), binary.PLAYER)
+    assert reader.str() == 'unused'
+    with pytest.raises(ValueError):
+        reader.str()